@@ -3,6 +3,7 @@ Theophysics Research Manager - Standalone GUI Application
 Comprehensive research management system for Obsidian vaults
 """
 
+import multiprocessing
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
 
@@ -71,5 +72,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # The paper scanner runs NLP in worker processes
+    multiprocessing.freeze_support()
     main()
 
@@ -9,11 +9,17 @@ Based on user's specification:
 - Adds ## Review Status with [REVIEW] flags
 """
 
+import hashlib
 import os
 import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict, Set
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Try to import wikipedia
 try:
@@ -39,6 +45,38 @@ SECTION_ORDER = [
     "## 7. Narrative Definition",
 ]
 
+# Engine key for each section header
+SECTION_KEYS = {
+    "## 1. Aliases": "aliases",
+    "## 2. Core Definition": "core",
+    "## 3. Operational Definition": "operational",
+    "## 4. Ontological Context": "ontology",
+    "## 5. Relationships": "relationships",
+    "## 6. Scientific Definition": "scientific",
+    "## 7. Narrative Definition": "narrative",
+}
+
+# Patterns used for every file of a folder run, compiled once
+_SECTION_HEADER_RE = re.compile(r"(##\s+[0-9]+\.\s+.+)")
+_TEMPLATE_MARKER_RE = re.compile(r"## (?:1\. Aliases|2\. Core Definition)")
+_FM_ALIASES_INLINE_RE = re.compile(r'aliases:\s*\[(.*?)\]')
+_FM_ALIASES_BLOCK_RE = re.compile(r'aliases:\s*\n((?:\s*-\s*[^\n]+\n?)+)')
+_FM_LIST_ITEM_RE = re.compile(r'-\s*([^\n]+)')
+_ALIASES_SECTION_RE = re.compile(r'##\s*1\.\s*Aliases\s*\n(.*?)(?=\n##|\Z)', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'#(\w+)')
+_WIKILINK_RE = re.compile(r'\[\[([^\]]+)\]\]')
+
+# Wikipedia fetch concurrency for folder runs, and the minimum spacing
+# between summary lookups shared by all workers (keeps us a polite client)
+WIKIPEDIA_WORKERS = 8
+WIKIPEDIA_MIN_INTERVAL = 0.1  # seconds
+
+# On-disk cache of Wikipedia summaries. The wikipedia package does not
+# expose response headers, so entries expire after a fixed age instead of
+# being revalidated.
+WIKI_CACHE_PATH = Path.home() / ".cache" / "theophysics" / "wiki.sqlite"
+WIKI_CACHE_TTL = 7 * 24 * 3600  # seconds
+
 # Provenance tags
 TAG_W = "[W]"  # external (Wikipedia)
 TAG_A = "[A]"  # AI-generated
@@ -61,6 +99,88 @@ class EngineResult:
 # UTILITIES
 # -----------------------------
 
+_wiki_lock = threading.Lock()
+_wiki_last_call = 0.0
+
+
+def _wiki_throttle() -> None:
+    """Block until WIKIPEDIA_MIN_INTERVAL has passed since the last lookup."""
+    global _wiki_last_call
+    with _wiki_lock:
+        wait = _wiki_last_call + WIKIPEDIA_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _wiki_last_call = time.monotonic()
+
+
+# One cache connection per thread (sqlite3 connections are not shared
+# across threads); the table is created by whichever thread connects first
+_wiki_cache_local = threading.local()
+_wiki_cache_init_lock = threading.Lock()
+_wiki_cache_ready = False
+
+
+def _wiki_cache_connect() -> Optional[sqlite3.Connection]:
+    """This thread's connection to the summary cache, or None if it is unavailable."""
+    global _wiki_cache_ready
+    if hasattr(_wiki_cache_local, 'conn'):
+        return _wiki_cache_local.conn
+    
+    conn = None
+    try:
+        with _wiki_cache_init_lock:
+            if not _wiki_cache_ready:
+                WIKI_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(WIKI_CACHE_PATH), timeout=5)
+            if not _wiki_cache_ready:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS summaries "
+                        "(key TEXT PRIMARY KEY, body TEXT NOT NULL, fetched_at REAL NOT NULL)"
+                    )
+                _wiki_cache_ready = True
+    except (OSError, sqlite3.Error) as e:
+        print(f"Wikipedia cache unavailable: {e}")
+        if conn is not None:
+            conn.close()
+        conn = None
+    # Remembered even when None, so a broken cache isn't retried per lookup
+    _wiki_cache_local.conn = conn
+    return conn
+
+
+def _cached_summary(search_term: str, sentences: int) -> Optional[str]:
+    """
+    wikipedia.summary() backed by the on-disk cache. Lookup errors
+    propagate; cache errors only cost the caching.
+    """
+    key = hashlib.sha1(f"{sentences}:{search_term.lower()}".encode("utf-8")).hexdigest()
+    conn = _wiki_cache_connect()
+    if conn is not None:
+        try:
+            row = conn.execute(
+                "SELECT body, fetched_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row and time.time() - row[1] < WIKI_CACHE_TTL:
+                return row[0]
+        except (OSError, sqlite3.Error) as e:
+            print(f"Wikipedia cache read failed: {e}")
+    
+    _wiki_throttle()
+    result = wikipedia.summary(search_term, sentences=sentences)
+    
+    if result and conn is not None:
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO summaries (key, body, fetched_at) VALUES (?, ?, ?)",
+                    (key, result, time.time())
+                )
+        except (OSError, sqlite3.Error) as e:
+            print(f"Wikipedia cache write failed: {e}")
+    return result
+
+
 def fetch_external_summary(term: str, sentences: int = 4, aliases: List[str] = None) -> Optional[str]:
     """
     Fetch a summary for the term from Wikipedia.
@@ -76,14 +196,14 @@ def fetch_external_summary(term: str, sentences: int = 4, aliases: List[str] = N
     
     for search_term in terms_to_try:
         try:
-            result = wikipedia.summary(search_term, sentences=sentences)
+            result = _cached_summary(search_term, sentences)
             if result:
                 return result
         except wikipedia.exceptions.DisambiguationError as e:
             # Try the first option
             if e.options:
                 try:
-                    return wikipedia.summary(e.options[0], sentences=sentences)
+                    return _cached_summary(e.options[0], sentences)
                 except:
                     continue
         except wikipedia.exceptions.PageError:
@@ -105,20 +225,20 @@ def extract_aliases_from_content(content: str) -> List[str]:
         if fm_end > 0:
             frontmatter = content[3:fm_end]
             # Look for aliases: [list] or aliases:\n- item
-            alias_match = re.search(r'aliases:\s*\[(.*?)\]', frontmatter)
+            alias_match = _FM_ALIASES_INLINE_RE.search(frontmatter)
             if alias_match:
                 # Parse [alias1, alias2] format
                 alias_str = alias_match.group(1)
                 aliases = [a.strip().strip('"\'') for a in alias_str.split(',') if a.strip()]
             else:
                 # Parse yaml list format
-                alias_match = re.search(r'aliases:\s*\n((?:\s*-\s*[^\n]+\n?)+)', frontmatter)
+                alias_match = _FM_ALIASES_BLOCK_RE.search(frontmatter)
                 if alias_match:
                     alias_lines = alias_match.group(1)
-                    aliases = [a.strip() for a in re.findall(r'-\s*([^\n]+)', alias_lines)]
+                    aliases = [a.strip() for a in _FM_LIST_ITEM_RE.findall(alias_lines)]
     
     # Also check ## 1. Aliases section
-    alias_section = re.search(r'##\s*1\.\s*Aliases\s*\n(.*?)(?=\n##|\Z)', content, re.DOTALL | re.IGNORECASE)
+    alias_section = _ALIASES_SECTION_RE.search(content)
     if alias_section:
         section_text = alias_section.group(1)
         # Extract any terms that look like aliases (comma-separated, bullet points, etc.)
@@ -145,8 +265,7 @@ def split_glossary_sections(text: str) -> Tuple[str, List[Tuple[str, str]], str]
       sections: list of (header, body)
       suffix (after last recognized section)
     """
-    pattern = r"(##\s+[0-9]+\.\s+.+)"
-    parts = re.split(pattern, text)
+    parts = _SECTION_HEADER_RE.split(text)
 
     if len(parts) == 1:
         return text, [], ""
@@ -452,23 +571,7 @@ def process_single_file(path: Path, dry_run: bool = False, skip_wikipedia: bool
         raw_body = section_map[header]
         main_body, _old_diag = section_main_body_and_existing_diag(raw_body)
 
-        # Determine section key
-        if "Core Definition" in header:
-            key = "core"
-        elif "Scientific Definition" in header:
-            key = "scientific"
-        elif "Operational Definition" in header:
-            key = "operational"
-        elif "Ontological Context" in header:
-            key = "ontology"
-        elif "Narrative Definition" in header:
-            key = "narrative"
-        elif "Aliases" in header:
-            key = "aliases"
-        elif "Relationships" in header:
-            key = "relationships"
-        else:
-            key = "other"
+        key = SECTION_KEYS[header]
 
         # Skip relationships - don't auto-generate tables
         if key == "relationships":
@@ -582,22 +685,31 @@ def process_glossary_folder(
     skip_wikipedia: bool = False,
     progress_callback=None
 ) -> List[EngineResult]:
-    """Process all definition files in a folder."""
-    results = []
+    """
+    Process all definition files in a folder.
     
+    Files are independent, so they run on a small thread pool to overlap
+    Wikipedia round-trips; lookups stay rate limited by _wiki_throttle.
+    progress_callback is always called from the calling thread.
+    """
     if recursive:
         md_files = list(folder.rglob("*.md"))
     else:
         md_files = list(folder.glob("*.md"))
     
     total = len(md_files)
-    
-    for idx, md_file in enumerate(md_files):
-        if progress_callback:
-            progress_callback(int((idx / max(total, 1)) * 100), f"Processing {md_file.name}...")
-        
-        result = process_single_file(md_file, dry_run=dry_run, skip_wikipedia=skip_wikipedia)
-        results.append(result)
+    results: List[Optional[EngineResult]] = [None] * total
+    
+    with ThreadPoolExecutor(max_workers=WIKIPEDIA_WORKERS) as executor:
+        futures = {
+            executor.submit(process_single_file, md_file, dry_run, skip_wikipedia): idx
+            for idx, md_file in enumerate(md_files)
+        }
+        for done, future in enumerate(as_completed(futures)):
+            idx = futures[future]
+            results[idx] = future.result()
+            if progress_callback:
+                progress_callback(int((done / max(total, 1)) * 100), f"Processed {md_files[idx].name}")
     
     if progress_callback:
         progress_callback(100, "Complete!")
@@ -610,7 +722,10 @@ def fill_single_term_from_wikipedia(term: str) -> Dict[str, str]:
     Fetch Wikipedia data for a single term and return generated sections.
     Does NOT write to file - returns dict of section content.
     """
-    external_summary = fetch_external_summary(term)
+    try:
+        external_summary = _session_summary(term)
+    except LookupError:
+        external_summary = None
     
     return {
         'core': generate_core_definition(term, external_summary),
@@ -623,6 +738,16 @@ def fill_single_term_from_wikipedia(term: str) -> Dict[str, str]:
     }
 
 
+@lru_cache(maxsize=256)
+def _session_summary(term: str) -> str:
+    """Summary for a term, memoized for the session when one is found."""
+    external_summary = fetch_external_summary(term)
+    if external_summary is None:
+        # lru_cache does not store exceptions, so a later click retries
+        raise LookupError(term)
+    return external_summary
+
+
 # -----------------------------
 # TEMPLATE INJECTION
 # -----------------------------
@@ -689,7 +814,7 @@ def inject_template_into_file(path: Path, dry_run: bool = False) -> dict:
         return result
     
     # Check if template already exists
-    if '## 2. Core Definition' in content or '## 1. Aliases' in content:
+    if _TEMPLATE_MARKER_RE.search(content):
         result['action'] = 'skipped'
         result['reason'] = 'Already has template structure'
         return result
@@ -712,11 +837,11 @@ def inject_template_into_file(path: Path, dry_run: bool = False) -> dict:
             body_content = content[fm_end+3:].strip()
     
     # Extract any existing tags
-    existing_tags = re.findall(r'#(\w+)', content)
+    existing_tags = _TAG_RE.findall(content)
     tags_str = ' '.join([f'#{t}' for t in existing_tags[:10]]) if existing_tags else '#glossary #theophysics'
     
     # Extract any existing links
-    existing_links = re.findall(r'\[\[([^\]]+)\]\]', content)
+    existing_links = _WIKILINK_RE.findall(content)
     links_str = ', '.join([f'[[{l}]]' for l in existing_links[:10]]) if existing_links else ''
     
     # Check for existing content that might be a definition
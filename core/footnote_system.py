@@ -6,6 +6,7 @@ from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass
@@ -22,6 +23,12 @@ class Footnote:
             self.academic_links = {}
 
 
+@lru_cache(maxsize=1024)
+def _term_pattern(term: str) -> re.Pattern:
+    """Case-insensitive whole-word pattern for a term, compiled once."""
+    return re.compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE)
+
+
 class FootnoteSystem:
     """Manages footnote generation and linking."""
     
@@ -132,7 +139,7 @@ class FootnoteSystem:
                 continue
             
             # Find term in text (case-insensitive, whole word)
-            pattern = re.compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE)
+            pattern = _term_pattern(term)
             
             # Check if term already has a footnote marker
             if pattern.search(result_text):
@@ -172,9 +179,7 @@ class FootnoteSystem:
             # Add academic links
             if footnote.academic_links:
                 for source, url in sorted(footnote.academic_links.items()):
-                    source_name = self.research_linker.LINK_TEMPLATES.get(
-                        source, {}
-                    ).get('display_name', source.replace('_', ' ').title())
+                    source_name = self.research_linker.display_name(source)
                     lines.append(f"   🔗 [{source_name}]({url})")
             
             lines.append("")
@@ -186,6 +191,20 @@ class FootnoteSystem:
         self.footnotes = []
         self.term_to_footnote = {}
     
+    def empty_copy(self) -> 'FootnoteSystem':
+        """
+        New, empty system sharing this one's linker and vault path.
+        
+        Text can be processed on it in a worker thread without touching
+        this system's footnotes; adopt() then takes the results over.
+        """
+        return FootnoteSystem(self.research_linker, self.vault_path)
+    
+    def adopt(self, other: 'FootnoteSystem') -> None:
+        """Replace this system's footnotes with those of another."""
+        self.footnotes = other.footnotes
+        self.term_to_footnote = other.term_to_footnote
+    
     def get_footnote(self, marker: int) -> Optional[Footnote]:
         """Get a footnote by marker number."""
         for footnote in self.footnotes:
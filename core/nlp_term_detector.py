@@ -10,11 +10,16 @@ This module:
 
 from __future__ import annotations
 
+import os
 import re
 import json
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
-from collections import Counter
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Set, Tuple, Optional
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 # Try to import spaCy - graceful fallback if not available
@@ -35,6 +40,118 @@ except ImportError:
     print("⚠️ requests/beautifulsoup4 not installed. Run: pip install requests beautifulsoup4")
 
 
+def _env_int(name: str, default: int) -> int:
+    """Positive integer from the environment, or default."""
+    try:
+        value = int(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+# Documents per spaCy nlp.pipe batch (32-128 works well)
+PIPE_BATCH_SIZE = _env_int("PAPER_SCAN_BATCH", 64)
+# spaCy components the detector never reads (it only uses doc.ents)
+UNUSED_PIPES = ("parser", "tagger", "attribute_ruler", "lemmatizer", "senter")
+
+# Concurrent SEP/Wikipedia lookups in resolve_links
+LINK_LOOKUP_WORKERS = 8
+
+# On-disk cache of SEP/Wikipedia lookups, including "no result" answers.
+# Failed requests are not cached.
+LINK_CACHE_PATH = Path.home() / ".cache" / "theophysics" / "links.sqlite"
+LINK_CACHE_TTL = 30 * 24 * 3600  # seconds
+
+# Lookups already answered this session: (service, lowercased term) -> link
+_link_memo: Dict[Tuple[str, str], Optional[str]] = {}
+
+
+# One cache connection per thread (sqlite3 connections are not shared
+# across threads); the table is created by whichever thread connects first
+_link_cache_local = threading.local()
+_link_cache_init_lock = threading.Lock()
+_link_cache_ready = False
+
+
+def _link_cache_connect() -> Optional[sqlite3.Connection]:
+    """This thread's connection to the link cache, or None if it is unavailable."""
+    global _link_cache_ready
+    if hasattr(_link_cache_local, 'conn'):
+        return _link_cache_local.conn
+    
+    conn = None
+    try:
+        with _link_cache_init_lock:
+            if not _link_cache_ready:
+                LINK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(LINK_CACHE_PATH), timeout=5)
+            if not _link_cache_ready:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS links "
+                        "(service TEXT NOT NULL, term TEXT NOT NULL, link TEXT, fetched_at REAL NOT NULL, "
+                        "PRIMARY KEY (service, term))"
+                    )
+                _link_cache_ready = True
+    except (OSError, sqlite3.Error) as e:
+        print(f"Link cache unavailable: {e}")
+        if conn is not None:
+            conn.close()
+        conn = None
+    # Remembered even when None, so a broken cache isn't retried per term
+    _link_cache_local.conn = conn
+    return conn
+
+
+def _cached_link(service: str, term: str, fetch: Callable[[str], Optional[str]]) -> Optional[str]:
+    """
+    fetch(term) backed by the session and on-disk caches. Fetch errors
+    propagate; cache errors only cost the caching.
+    """
+    key = (service, term.lower())
+    if key in _link_memo:
+        return _link_memo[key]
+    
+    conn = _link_cache_connect()
+    if conn is not None:
+        try:
+            row = conn.execute(
+                "SELECT link, fetched_at FROM links WHERE service = ? AND term = ?", key
+            ).fetchone()
+            if row and time.time() - row[1] < LINK_CACHE_TTL:
+                _link_memo[key] = row[0]
+                return row[0]
+        except sqlite3.Error as e:
+            print(f"Link cache read failed: {e}")
+    
+    link = fetch(term)
+    _link_memo[key] = link
+    if conn is not None:
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO links (service, term, link, fetched_at) VALUES (?, ?, ?, ?)",
+                    (*key, link, time.time())
+                )
+        except sqlite3.Error as e:
+            print(f"Link cache write failed: {e}")
+    return link
+
+
+def read_markdown(path) -> str:
+    """
+    Read a whole file as UTF-8 text.
+    
+    Reads the raw bytes and decodes once, skipping the text-mode wrapper.
+    Undecodable bytes are replaced; line endings are normalized to \\n
+    as read_text() would.
+    """
+    text = Path(path).read_bytes().decode('utf-8', 'replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
 @dataclass
 class DetectedTerm:
     """A term detected in text."""
@@ -44,6 +161,16 @@ class DetectedTerm:
     sources: List[str] = field(default_factory=list)  # Which files it was found in
     link: Optional[str] = None
     link_source: Optional[str] = None  # 'dictionary', 'sep', 'wikipedia', etc.
+    _seen_sources: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._seen_sources.update(self.sources)
+    
+    def add_source(self, source: str) -> None:
+        """Record another file the term was found in, once."""
+        if source not in self._seen_sources:
+            self._seen_sources.add(source)
+            self.sources.append(source)
     
 
 class NLPTermDetector:
@@ -164,6 +291,9 @@ class NLPTermDetector:
                     self.nlp = spacy.load("en_core_web_sm")
                 except OSError:
                     print("⚠️ No spaCy model found. Run: python -m spacy download en_core_web_lg")
+            if self.nlp is not None:
+                # Only entities are used; skip the components that don't feed NER
+                self.nlp.select_pipes(disable=[p for p in UNUSED_PIPES if p in self.nlp.pipe_names])
         
         # Load custom dictionary if provided
         if custom_dictionary_path and custom_dictionary_path.exists():
@@ -191,6 +321,32 @@ class NLPTermDetector:
         
         Returns list of DetectedTerm objects.
         """
+        doc = self.nlp(text) if self.nlp else None
+        return self._collect_terms(text, source_file, doc)
+    
+    def detect_terms_pipe(
+        self,
+        texts: Iterable[Tuple[str, str]],
+        batch_size: Optional[int] = None
+    ) -> Iterator[Tuple[str, List[DetectedTerm]]]:
+        """
+        Detect terms in many (text, source_file) pairs.
+        
+        Documents go through spaCy's nlp.pipe in batches, which is much
+        faster than one detect_terms call per document. Yields
+        (source_file, terms) in input order.
+        """
+        if not self.nlp:
+            for text, source_file in texts:
+                yield source_file, self._collect_terms(text, source_file, None)
+            return
+        
+        docs = self.nlp.pipe(texts, as_tuples=True, batch_size=batch_size or PIPE_BATCH_SIZE)
+        for doc, source_file in docs:
+            yield source_file, self._collect_terms(doc.text, source_file, doc)
+    
+    def _collect_terms(self, text: str, source_file: str, doc) -> List[DetectedTerm]:
+        """Build the DetectedTerms for text; doc is its spaCy Doc, or None."""
         detected = {}
         
         # Method 1: Check against our dictionaries (most reliable)
@@ -212,13 +368,11 @@ class NLPTermDetector:
                     )
                 else:
                     detected[term_lower].count += count
-                    if source_file and source_file not in detected[term_lower].sources:
-                        detected[term_lower].sources.append(source_file)
+                    if source_file:
+                        detected[term_lower].add_source(source_file)
         
         # Method 2: Use spaCy NER if available
-        if self.nlp:
-            doc = self.nlp(text)
-            
+        if doc is not None:
             for ent in doc.ents:
                 term = ent.text.strip()
                 term_lower = term.lower()
@@ -256,8 +410,8 @@ class NLPTermDetector:
                     )
                 else:
                     detected[term_lower].count += 1
-                    if source_file and source_file not in detected[term_lower].sources:
-                        detected[term_lower].sources.append(source_file)
+                    if source_file:
+                        detected[term_lower].add_source(source_file)
         
         # Method 3: Regex patterns for things NLP might miss
         patterns = [
@@ -298,23 +452,29 @@ class NLPTermDetector:
             return None
         
         try:
-            url = f"https://plato.stanford.edu/search/searcher.py?query={term.replace(' ', '+')}"
-            response = requests.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                # Find first result that's an entry
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    if 'entries/' in href:
-                        if href.startswith('/'):
-                            return f"https://plato.stanford.edu{href}"
-                        return href
+            return _cached_link('sep', term, self._fetch_sep)
         except Exception as e:
             print(f"SEP search error for '{term}': {e}")
         
         return None
     
+    @staticmethod
+    def _fetch_sep(term: str) -> Optional[str]:
+        """Query SEP for a term; request errors propagate."""
+        url = f"https://plato.stanford.edu/search/searcher.py?query={term.replace(' ', '+')}"
+        response = requests.get(url, timeout=5)
+        response.raise_for_status()
+        
+        soup = BeautifulSoup(response.text, 'html.parser')
+        # Find first result that's an entry
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if 'entries/' in href:
+                if href.startswith('/'):
+                    return f"https://plato.stanford.edu{href}"
+                return href
+        return None
+    
     def search_wikipedia(self, term: str) -> Optional[str]:
         """
         Search Wikipedia for a term.
@@ -324,43 +484,61 @@ class NLPTermDetector:
             return None
         
         try:
-            # Use Wikipedia API
-            url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={term.replace(' ', '+')}&format=json"
-            response = requests.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get('query', {}).get('search', [])
-                if results:
-                    title = results[0]['title']
-                    return f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+            return _cached_link('wikipedia', term, self._fetch_wikipedia)
         except Exception as e:
             print(f"Wikipedia search error for '{term}': {e}")
         
         return None
     
-    def resolve_links(self, terms: List[DetectedTerm], use_sep: bool = True, use_wikipedia: bool = True) -> List[DetectedTerm]:
+    @staticmethod
+    def _fetch_wikipedia(term: str) -> Optional[str]:
+        """Query the Wikipedia search API for a term; request errors propagate."""
+        url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={term.replace(' ', '+')}&format=json"
+        response = requests.get(url, timeout=5)
+        response.raise_for_status()
+        
+        results = response.json().get('query', {}).get('search', [])
+        if results:
+            title = results[0]['title']
+            return f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+        return None
+    
+    def resolve_links(
+        self,
+        terms: List[DetectedTerm],
+        use_sep: bool = True,
+        use_wikipedia: bool = True,
+        max_workers: int = LINK_LOOKUP_WORKERS
+    ) -> List[DetectedTerm]:
         """
         Try to find links for terms that don't have them.
+        
+        Lookups for different terms run concurrently on up to max_workers
+        threads; each term still tries SEP before Wikipedia.
         """
-        for term in terms:
-            if term.link:
-                continue
-            
+        pending = [term for term in terms if not term.link]
+        if not pending:
+            return terms
+        
+        def lookup(term: DetectedTerm) -> Tuple[Optional[str], Optional[str]]:
             # Try SEP first
             if use_sep:
                 link = self.search_sep(term.text)
                 if link:
-                    term.link = link
-                    term.link_source = 'sep'
-                    continue
+                    return link, 'sep'
             
             # Try Wikipedia
             if use_wikipedia:
                 link = self.search_wikipedia(term.text)
+                if link:
+                    return link, 'wikipedia'
+            return None, None
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+            for term, (link, link_source) in zip(pending, executor.map(lookup, pending)):
                 if link:
                     term.link = link
-                    term.link_source = 'wikipedia'
+                    term.link_source = link_source
         
         return terms
     
@@ -422,6 +600,86 @@ class NLPTermDetector:
         return result
 
 
+# Detector of the current process, shared by scan batches so a pool
+# worker loads the spaCy model only once
+_process_detector: Optional[NLPTermDetector] = None
+
+
+def _get_detector() -> NLPTermDetector:
+    """Detector for this process, created on first use."""
+    global _process_detector
+    if _process_detector is None:
+        _process_detector = NLPTermDetector()
+    return _process_detector
+
+
+def iter_terms_in_files(
+    paths: Iterable[str],
+    detector: Optional[NLPTermDetector] = None
+) -> Iterator[Tuple[str, Optional[List[DetectedTerm]]]]:
+    """
+    Read markdown files and detect the terms in each, in order.
+    
+    Files are read lazily and batched through detect_terms_pipe. Without
+    a detector the process's own is used. Files that fail come back with
+    None.
+    """
+    if detector is None:
+        detector = _get_detector()
+    
+    failed = set()
+    # Documents handed to spaCy but not yet yielded back
+    pending: Deque[Tuple[str, str]] = deque()
+    max_length = detector.nlp.max_length if detector.nlp else None
+    
+    def texts():
+        for path in paths:
+            try:
+                text = read_markdown(path)
+                if max_length is not None and len(text) > max_length:
+                    raise ValueError(f"{len(text)} characters exceeds spaCy's max_length ({max_length})")
+            except Exception as e:
+                print(f"Error reading {path}: {e}")
+                failed.add(path)
+                # Keep the slot so results stay in order
+                text = ""
+            pending.append((text, path))
+            yield text, path
+    
+    texts_iter = texts()
+    try:
+        for path, terms in detector.detect_terms_pipe(texts_iter):
+            pending.popleft()
+            yield path, None if path in failed else terms
+    except Exception as e:
+        # A document spaCy could not process; finish one file at a time so
+        # only the failing file is skipped
+        print(f"Batch detection error, continuing per file: {e}")
+        for _ in texts_iter:  # reads the remaining files into pending
+            pass
+        for text, path in pending:
+            if path in failed:
+                yield path, None
+                continue
+            try:
+                yield path, detector.detect_terms(text, path)
+            except Exception as e:
+                print(f"Error detecting terms in {path}: {e}")
+                yield path, None
+
+
+def detect_terms_in_files(
+    paths: List[str],
+    detector: Optional[NLPTermDetector] = None
+) -> List[Tuple[str, Optional[List[DetectedTerm]]]]:
+    """
+    Detect the terms in a batch of markdown files.
+    
+    Module-level so process pools can run it; see iter_terms_in_files.
+    """
+    return list(iter_terms_in_files(paths, detector))
+
+
 # Convenience function for quick use
 def detect_and_link(text: str, source_file: str = "") -> Tuple[List[DetectedTerm], str]:
     """
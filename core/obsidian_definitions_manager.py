@@ -5,7 +5,9 @@ Obsidian Definitions Manager - Core logic for managing definitions
 from __future__ import annotations
 
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass
@@ -86,20 +88,29 @@ class ObsidianDefinitionsManager:
         self.settings.set("obsidian", "vault_path", str(vault_path))
         self.scan_definitions()
 
+    def collect_paths(self) -> List[Path]:
+        """List all markdown files in the definitions folder."""
+        if not self.definitions_folder or not self.definitions_folder.exists():
+            return []
+        return list(self.definitions_folder.rglob("*.md"))
+
     def scan_definitions(self) -> List[DefinitionFile]:
         """Scan for definition files in the vault."""
         if not self.definitions_folder or not self.definitions_folder.exists():
             return []
 
-        self.definition_files = []
-        
-        # Find all markdown files in definitions folder
-        for md_file in self.definitions_folder.rglob("*.md"):
-            def_file = self._parse_definition_file(md_file)
-            if def_file:
-                self.definition_files.append(def_file)
+        # Enumerate first, then parse the files on a thread pool; parsing is
+        # dominated by file reads. map() keeps the original file order.
+        paths = self.collect_paths()
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = executor.map(self._parse_definition_file, paths)
+            # Build into a local list and swap it in at the end, so readers
+            # on other threads never see a half-filled scan
+            definition_files = [def_file for def_file in parsed if def_file]
 
-        return self.definition_files
+        self.definition_files = definition_files
+        return definition_files
 
     def _parse_definition_file(self, file_path: Path) -> Optional[DefinitionFile]:
         """Parse a definition file."""
@@ -2,11 +2,23 @@
 PostgreSQL Manager - Stores definitions, footnotes, research links, and memories.
 """
 
+from __future__ import annotations
+
 from typing import List, Dict, Optional, Any
 from pathlib import Path
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from psycopg2 import sql
+import threading
+
+# Import psycopg2 (and its libpq DLLs) at startup rather than on first click
+try:
+    import psycopg2
+    from psycopg2.extras import RealDictCursor
+    from psycopg2.pool import ThreadedConnectionPool
+    from psycopg2 import sql
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    psycopg2 = None
+    PSYCOPG2_AVAILABLE = False
+    print("⚠️ psycopg2 not installed. Run: pip install psycopg2-binary")
 from dataclasses import dataclass, asdict
 import json
 from datetime import datetime
@@ -20,36 +32,131 @@ class DatabaseConfig:
     database: str = "theophysics_research"
     user: str = "postgres"
     password: str = ""
+    connect_timeout: int = 5
 
 
 class PostgresManager:
     """Manages PostgreSQL database for Theophysics Research Manager."""
     
+    POOL_MIN_CONN = 1
+    POOL_MAX_CONN = 8
+    
     def __init__(self, config: Optional[DatabaseConfig] = None):
         """Initialize PostgreSQL manager."""
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        # Connection -> the pool it was borrowed from, and per pool the number
+        # of connections lent out (or being opened), so a pool replaced by a
+        # config change is only closed once its last connection comes back
+        self._lent_from: Dict[Any, ThreadedConnectionPool] = {}
+        self._lent_count: Dict[ThreadedConnectionPool, int] = {}
         self.config = config or DatabaseConfig()
         self.conn = None
         self._ensure_schema()
     
-    def connect(self) -> bool:
-        """Connect to PostgreSQL database."""
-        try:
-            self.conn = psycopg2.connect(
+    @property
+    def config(self) -> DatabaseConfig:
+        """Current connection configuration."""
+        return self._config
+    
+    @config.setter
+    def config(self, config: DatabaseConfig) -> None:
+        """Replace the configuration; the old pool closes once it is idle."""
+        if getattr(self, "_config", None) != config:
+            self._retire_pool()
+        self._config = config
+    
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Return the connection pool, creating it on first use. Caller holds _pool_lock."""
+        if self._pool is None:
+            self._pool = ThreadedConnectionPool(
+                minconn=self.POOL_MIN_CONN,
+                maxconn=self.POOL_MAX_CONN,
                 host=self.config.host,
                 port=self.config.port,
                 database=self.config.database,
                 user=self.config.user,
-                password=self.config.password
+                password=self.config.password,
+                connect_timeout=self.config.connect_timeout
             )
-            return True
-        except psycopg2.OperationalError as e:
+        return self._pool
+    
+    def _retire_pool(self) -> None:
+        """Stop handing out the current pool and close it when nothing is borrowed."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+            if pool is None or self._lent_count.get(pool):
+                return
+            self._lent_count.pop(pool, None)
+        pool.closeall()
+    
+    def _release(self, pool: ThreadedConnectionPool) -> None:
+        """Count one connection back in, closing a retired pool left idle."""
+        with self._pool_lock:
+            if pool not in self._lent_count:
+                return  # closed by close_pool()
+            self._lent_count[pool] -= 1
+            if self._lent_count[pool] or pool is self._pool:
+                return
+            del self._lent_count[pool]
+        pool.closeall()
+    
+    def close_pool(self) -> None:
+        """Close every pooled connection, including borrowed ones."""
+        with self._pool_lock:
+            pools = set(self._lent_count)
+            if self._pool is not None:
+                pools.add(self._pool)
+            self._pool = None
+            self._lent_count.clear()
+            self._lent_from.clear()
+        for pool in pools:
+            if not pool.closed:
+                pool.closeall()
+    
+    def getconn(self):
+        """Borrow a connection from the pool. Return it with putconn()."""
+        with self._pool_lock:
+            pool = self._get_pool()
+            self._lent_count[pool] = self._lent_count.get(pool, 0) + 1
+        try:
+            conn = pool.getconn()
+        except Exception:
+            self._release(pool)
+            raise
+        with self._pool_lock:
+            self._lent_from[conn] = pool
+        return conn
+    
+    def putconn(self, conn) -> None:
+        """Return a borrowed connection to the pool."""
+        with self._pool_lock:
+            pool = self._lent_from.pop(conn, None)
+        if pool is None or pool.closed:
+            conn.close()
+            return
+        pool.putconn(conn, close=bool(conn.closed))
+        self._release(pool)
+    
+    def _borrow(self):
+        """Borrow a pooled connection for the calling thread, or None on failure."""
+        if not PSYCOPG2_AVAILABLE:
+            return None
+        try:
+            return self.getconn()
+        except psycopg2.Error as e:
             print(f"Database connection failed: {e}")
-            return False
+            return None
+    
+    def connect(self) -> bool:
+        """Borrow a pooled connection into self.conn."""
+        self.conn = self._borrow()
+        return self.conn is not None
     
     def disconnect(self) -> None:
-        """Disconnect from database."""
+        """Return self.conn to the pool."""
         if self.conn:
-            self.conn.close()
+            self.putconn(self.conn)
             self.conn = None
     
     def _ensure_schema(self) -> None:
@@ -171,6 +278,63 @@ class PostgresManager:
         finally:
             self.disconnect()
     
+    def save_definitions_bulk(self, definitions: List[Dict[str, Any]]) -> bool:
+        """
+        Upsert many definitions in a single statement.
+        
+        Each column is sent as one array parameter and expanded server-side
+        with UNNEST, so the statement carries six parameters no matter how
+        many rows it inserts.
+        
+        Args:
+            definitions: Dicts with 'phrase' and 'definition', plus optional
+                'aliases', 'classification', 'folder' and 'vault_link'
+        """
+        if not definitions:
+            return True
+        
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement
+        by_phrase = {d["phrase"]: d for d in definitions}
+        rows = list(by_phrase.values())
+        
+        # Use a local connection so this is safe to call from worker threads
+        conn = self._borrow()
+        if conn is None:
+            return False
+        
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    INSERT INTO definitions (phrase, aliases, definition, classification, folder, vault_link)
+                    SELECT phrase, aliases::jsonb, definition,
+                           NULLIF(classification, ''), NULLIF(folder, ''), NULLIF(vault_link, '')
+                    FROM UNNEST(%s::text[], %s::text[], %s::text[], %s::text[], %s::text[], %s::text[])
+                        AS t(phrase, aliases, definition, classification, folder, vault_link)
+                    ON CONFLICT (phrase)
+                    DO UPDATE SET
+                        aliases = EXCLUDED.aliases,
+                        definition = EXCLUDED.definition,
+                        classification = EXCLUDED.classification,
+                        folder = EXCLUDED.folder,
+                        vault_link = EXCLUDED.vault_link,
+                        updated_at = CURRENT_TIMESTAMP
+                """, (
+                    [d["phrase"] for d in rows],
+                    [json.dumps(d.get("aliases") or []) for d in rows],
+                    [d["definition"] for d in rows],
+                    [d.get("classification") or "" for d in rows],
+                    [d.get("folder") or "" for d in rows],
+                    [d.get("vault_link") or "" for d in rows]
+                ))
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"Error saving definitions: {e}")
+            conn.rollback()
+            return False
+        finally:
+            self.putconn(conn)
+    
     def get_all_definitions(self) -> List[Dict[str, Any]]:
         """Get all definitions from database."""
         if not self.connect():
@@ -252,6 +416,47 @@ class PostgresManager:
         finally:
             self.disconnect()
     
+    def save_research_links_bulk(self, links: List[Dict[str, Any]]) -> bool:
+        """
+        Upsert many research links in a single UNNEST statement.
+        
+        Args:
+            links: Dicts with 'term', 'source', 'url' and optional 'priority'
+        """
+        if not links:
+            return True
+        
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement
+        by_key = {(l["term"], l["source"]): l for l in links}
+        rows = list(by_key.values())
+        
+        # Use a local connection so this is safe to call from worker threads
+        conn = self._borrow()
+        if conn is None:
+            return False
+        
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    INSERT INTO research_links (term, source, url, priority)
+                    SELECT * FROM UNNEST(%s::text[], %s::text[], %s::text[], %s::int[])
+                    ON CONFLICT (term, source)
+                    DO UPDATE SET url = EXCLUDED.url, priority = EXCLUDED.priority
+                """, (
+                    [l["term"] for l in rows],
+                    [l["source"] for l in rows],
+                    [l["url"] for l in rows],
+                    [l.get("priority", 0) for l in rows]
+                ))
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"Error saving research links: {e}")
+            conn.rollback()
+            return False
+        finally:
+            self.putconn(conn)
+    
     # Memories methods (for AI context)
     def save_memory(
         self,
@@ -302,6 +507,19 @@ class PostgresManager:
             self.disconnect()
     
     def test_connection(self) -> bool:
-        """Test database connection."""
-        return self.connect()
+        """Test database connection with a SELECT 1 on a pooled connection."""
+        conn = self._borrow()
+        if conn is None:
+            return False
+        
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error as e:
+            print(f"Database connection failed: {e}")
+            return False
+        finally:
+            self.putconn(conn)
 
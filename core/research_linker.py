@@ -5,6 +5,7 @@ for Stanford Encyclopedia, arXiv, IEP, and other academic sources.
 
 from typing import Dict, List, Optional
 from pathlib import Path
+from functools import lru_cache
 import re
 
 
@@ -106,6 +107,13 @@ class ResearchLinker:
         'arxiv', 'wikipedia'
     ]
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def display_name(source: str) -> str:
+        """Human-readable name of a link source."""
+        template = ResearchLinker.LINK_TEMPLATES.get(source, {})
+        return template.get('display_name', source.replace('_', ' ').title())
+    
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize the research linker."""
         self.config_path = config_path or Path(__file__).parent.parent / 'config' / 'research_links.json'
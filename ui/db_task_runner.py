@@ -0,0 +1,64 @@
+"""
+DB Task Runner - Runs database work off the GUI thread.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+
+class DbTaskRunner(QObject):
+    """
+    Shared thread pool for database sync/export jobs.
+
+    Jobs run on a small ThreadPoolExecutor; their completion callbacks are
+    delivered back on the GUI thread through a queued Qt signal, so callers
+    can touch widgets from them directly.
+    """
+
+    # (callback, result, error message)
+    _task_done = Signal(object, object, str)
+
+    def __init__(self, max_workers: int = 4, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-task")
+        self._task_done.connect(self._dispatch)
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_done: Optional[Callable[[Any, str], None]] = None
+    ) -> Future:
+        """
+        Run fn(*args) on the pool.
+
+        Args:
+            fn: Blocking callable to run
+            on_done: Called on the GUI thread as on_done(result, error);
+                error is an empty string on success
+        """
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda f: self._emit_done(on_done, f))
+        return future
+
+    def _emit_done(self, on_done: Optional[Callable], future: Future) -> None:
+        """Runs on the worker thread; hands the result to the GUI thread."""
+        if on_done is None:
+            return
+        error = future.exception()
+        if error is not None:
+            self._task_done.emit(on_done, None, str(error))
+        else:
+            self._task_done.emit(on_done, future.result(), "")
+
+    def _dispatch(self, on_done: Callable, result: Any, error: str) -> None:
+        """Invoke the callback on the GUI thread."""
+        on_done(result, error)
+
+    def shutdown(self) -> None:
+        """Stop accepting work and wait for running jobs."""
+        self._executor.shutdown(wait=True)
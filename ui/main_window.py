@@ -12,6 +12,7 @@ from PySide6.QtCore import Qt
 
 from typing import TYPE_CHECKING
 from .styles import DARK_THEME_STYLESHEET
+from .db_task_runner import DbTaskRunner
 
 if TYPE_CHECKING:
     from core.settings_manager import SettingsManager
@@ -42,6 +43,7 @@ class MainWindow(QMainWindow):
         self.research_linker = research_linker
         self.footnote_system = footnote_system
         self.postgres_manager = postgres_manager
+        self.db_runner = DbTaskRunner(parent=self)
 
         self.setWindowTitle("🔬 Theophysics Research Manager")
         self.setGeometry(100, 100, 1400, 900)
@@ -145,7 +147,7 @@ class MainWindow(QMainWindow):
 
         # Data Aggregation tab
         from .tabs.data_aggregation_tab import DataAggregationTab
-        data_aggregation_tab = DataAggregationTab()
+        data_aggregation_tab = DataAggregationTab(db_runner=self.db_runner)
         self.tab_widget.addTab(data_aggregation_tab, "🔗 Data Aggregation")
 
         # Research Linking tab
@@ -164,7 +166,12 @@ class MainWindow(QMainWindow):
 
         # Database tab
         from .tabs.database_tab import DatabaseTab
-        database_tab = DatabaseTab(self.postgres_manager)
+        database_tab = DatabaseTab(
+            self.postgres_manager,
+            definitions_manager=self.definitions_manager,
+            research_linker=self.research_linker,
+            db_runner=self.db_runner
+        )
         self.tab_widget.addTab(database_tab, "🗄️ Database")
 
         # Structure Builder tab
@@ -183,6 +190,11 @@ class MainWindow(QMainWindow):
         if hasattr(definitions_tab, 'refresh'):
             definitions_tab.refresh()
 
+    def closeEvent(self, event) -> None:
+        """Let queued database work finish before the window goes away."""
+        self.db_runner.shutdown()
+        super().closeEvent(event)
+
     def _setup_status_bar(self) -> None:
         """Setup the status bar."""
         self.status_bar = self.statusBar()
@@ -11,24 +11,62 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QThread, Signal
 from pathlib import Path
 import json
+import os
 
 from core.plugin_data_aggregator import PluginDataAggregator
+from ui.db_task_runner import DbTaskRunner
+
+# Import psycopg2 at startup so the first click doesn't pay the DLL load
+try:
+    import psycopg2
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+
+# (display name, plugin id, path)
+PLUGIN_SOURCES = (
+    ("Word Ontology", "word_ontology", r"D:\Word-ontology"),
+    ("Module Notes", "module_notes", r"D:\Obsidian-Plugin-Module-Notes"),
+    ("Link Tag Plugin", "link_tag", r"D:\Obsidian-link-tag-plugin"),
+    ("Tags Analytics", "tags_analytics", r"D:\Obsidian-Tags-Data-Analytics")
+)
+
+# Checked once at import so building the tab doesn't stat the drive
+PLUGIN_EXISTS = {plugin_id: os.path.isdir(path) for _, plugin_id, path in PLUGIN_SOURCES}
 
 
 class AggregationWorker(QThread):
     """Worker thread for aggregation operations."""
     progress = Signal(str)
+    scanned = Signal(dict)
     finished = Signal(dict)
     error = Signal(str)
     
-    def __init__(self, aggregator: PluginDataAggregator):
+    def __init__(self, aggregator: PluginDataAggregator, scan_results: dict = None):
+        """
+        Args:
+            aggregator: Aggregator to run
+            scan_results: Output of a previous scan_all_plugins(); when given,
+                the scan phase is skipped
+        """
         super().__init__()
         self.aggregator = aggregator
+        self.scan_results = scan_results
     
     def run(self):
         try:
-            self.progress.emit("Scanning plugins...")
-            results = self.aggregator.scan_all_plugins()
+            if self.scan_results is not None:
+                # Drop outputs of the previous run so they aren't saved again
+                results = {
+                    k: v for k, v in self.scan_results.items()
+                    if k not in ("output_file", "postgres_file")
+                }
+            else:
+                self.progress.emit("Scanning plugins...")
+                results = self.aggregator.scan_all_plugins()
+                # A copy, since output paths are added to results below
+                self.scanned.emit(dict(results))
             
             self.progress.emit("Aggregating data...")
             postgres_data = self.aggregator.aggregate_to_postgres_format(
@@ -37,22 +75,48 @@ class AggregationWorker(QThread):
             
             self.progress.emit("Saving aggregated data...")
             output_file = self.aggregator.save_aggregated_data(results)
+            postgres_file = self.aggregator.save_postgres_data(postgres_data, output_file)
+            # Export reloads from disk; don't keep a second copy alive in the results
+            del postgres_data
             
             results["output_file"] = str(output_file)
-            results["postgres_data"] = postgres_data
+            results["postgres_file"] = str(postgres_file)
             
             self.finished.emit(results)
         except Exception as e:
             self.error.emit(str(e))
 
 
+class ConnectTestWorker(QThread):
+    """Worker thread for testing a PostgreSQL connection string."""
+    finished = Signal(bool, str)
+    
+    CONNECT_TIMEOUT = 5
+    
+    def __init__(self, connection_string: str):
+        super().__init__()
+        self.connection_string = connection_string
+    
+    def run(self):
+        try:
+            # libpq parses postgresql:// URIs natively
+            conn = psycopg2.connect(self.connection_string, connect_timeout=self.CONNECT_TIMEOUT)
+            conn.close()
+            self.finished.emit(True, "")
+        except Exception as e:
+            self.finished.emit(False, str(e))
+
+
 class DataAggregationTab(QWidget):
     """Tab for data aggregation and PostgreSQL export."""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, db_runner: DbTaskRunner = None):
         super().__init__(parent)
         self.aggregator = None
         self.worker = None
+        self.connect_worker = None
+        self.last_results = None
+        self.db_runner = db_runner or DbTaskRunner(parent=self)
         self.init_ui()
     
     def init_ui(self):
@@ -68,17 +132,11 @@ class DataAggregationTab(QWidget):
         plugin_layout = QVBoxLayout()
         
         self.plugin_checkboxes = {}
-        plugins = [
-            ("Word Ontology", "word_ontology", r"D:\Word-ontology"),
-            ("Module Notes", "module_notes", r"D:\Obsidian-Plugin-Module-Notes"),
-            ("Link Tag Plugin", "link_tag", r"D:\Obsidian-link-tag-plugin"),
-            ("Tags Analytics", "tags_analytics", r"D:\Obsidian-Tags-Data-Analytics")
-        ]
-        
-        for name, plugin_id, path in plugins:
+        for name, plugin_id, path in PLUGIN_SOURCES:
             checkbox = QCheckBox(f"{name} ({path})")
             checkbox.setChecked(True)
-            checkbox.setEnabled(Path(path).exists())
+            checkbox.setEnabled(PLUGIN_EXISTS[plugin_id])
+            checkbox.toggled.connect(self.invalidate_scan)
             self.plugin_checkboxes[plugin_id] = checkbox
             plugin_layout.addWidget(checkbox)
         
@@ -96,6 +154,7 @@ class DataAggregationTab(QWidget):
         target_input.setPlaceholderText("Path to aggregation target folder")
         target_layout.addWidget(target_input)
         self.target_input = target_input
+        target_input.textChanged.connect(self.invalidate_scan)
         
         target_layout.addWidget(QLabel("This folder will contain all aggregated data"))
         target_group.setLayout(target_layout)
@@ -113,9 +172,9 @@ class DataAggregationTab(QWidget):
         postgres_layout.addWidget(postgres_input)
         self.postgres_input = postgres_input
         
-        test_btn = QPushButton("Test Connection")
-        test_btn.clicked.connect(self.test_postgres_connection)
-        postgres_layout.addWidget(test_btn)
+        self.test_btn = QPushButton("Test Connection")
+        self.test_btn.clicked.connect(self.test_postgres_connection)
+        postgres_layout.addWidget(self.test_btn)
         
         postgres_group.setLayout(postgres_layout)
         layout.addWidget(postgres_group)
@@ -132,9 +191,9 @@ class DataAggregationTab(QWidget):
         aggregate_btn.clicked.connect(self.aggregate_data)
         action_layout.addWidget(aggregate_btn)
         
-        export_btn = QPushButton("Export to PostgreSQL")
-        export_btn.clicked.connect(self.export_to_postgres)
-        action_layout.addWidget(export_btn)
+        self.export_btn = QPushButton("Export to PostgreSQL")
+        self.export_btn.clicked.connect(self.export_to_postgres)
+        action_layout.addWidget(self.export_btn)
         
         action_group.setLayout(action_layout)
         layout.addWidget(action_group)
@@ -165,29 +224,23 @@ class DataAggregationTab(QWidget):
     
     def test_postgres_connection(self):
         """Test PostgreSQL connection."""
-        connection_string = self.postgres_input.text()
-        try:
-            import psycopg2
-            conn_str = connection_string.replace("postgresql://", "")
-            user_pass, host_db = conn_str.split("@")
-            user, password = user_pass.split(":")
-            host, port_db = host_db.split(":")
-            port, database = port_db.split("/")
-            
-            conn = psycopg2.connect(
-                host=host,
-                port=int(port),
-                database=database,
-                user=user,
-                password=password
-            )
-            conn.close()
-            
-            QMessageBox.information(self, "Success", "PostgreSQL connection successful!")
-        except ImportError:
+        if not PSYCOPG2_AVAILABLE:
             QMessageBox.warning(self, "Error", "psycopg2 not installed.\nInstall with: pip install psycopg2-binary")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Connection failed:\n{str(e)}")
+            return
+        
+        self.test_btn.setEnabled(False)
+        self.connect_worker = ConnectTestWorker(self.postgres_input.text())
+        self.connect_worker.finished.connect(self.on_connection_tested)
+        self.connect_worker.start()
+    
+    def on_connection_tested(self, ok: bool, error: str):
+        """Handle connection test result."""
+        self.test_btn.setEnabled(True)
+        
+        if ok:
+            QMessageBox.information(self, "Success", "PostgreSQL connection successful!")
+        else:
+            QMessageBox.critical(self, "Error", f"Connection failed:\n{error}")
     
     def scan_plugins(self):
         """Scan all enabled plugins."""
@@ -201,8 +254,25 @@ class DataAggregationTab(QWidget):
         for plugin_id, checkbox in self.plugin_checkboxes.items():
             self.aggregator.plugins[plugin_id].enabled = checkbox.isChecked()
         
-        self.worker = AggregationWorker(self.aggregator)
+        self._start_worker(AggregationWorker(self.aggregator))
+    
+    def aggregate_data(self):
+        """Aggregate data from all plugins, reusing the last scan if still valid."""
+        if not self.aggregator or not self.last_results:
+            self.scan_plugins()
+            return
+        
+        self._start_worker(AggregationWorker(self.aggregator, scan_results=self.last_results))
+    
+    def invalidate_scan(self, *args):
+        """Forget the cached scan after the plugin selection or target changes."""
+        self.last_results = None
+    
+    def _start_worker(self, worker: AggregationWorker):
+        """Wire up and start an aggregation worker."""
+        self.worker = worker
         self.worker.progress.connect(self.update_progress)
+        self.worker.scanned.connect(self.on_scan_finished)
         self.worker.finished.connect(self.on_aggregation_finished)
         self.worker.error.connect(self.on_aggregation_error)
         
@@ -210,40 +280,49 @@ class DataAggregationTab(QWidget):
         self.progress_bar.setRange(0, 0)  # Indeterminate
         self.worker.start()
     
-    def aggregate_data(self):
-        """Aggregate data from all plugins."""
-        if not self.aggregator:
-            self.scan_plugins()
-        else:
-            self.scan_plugins()  # Re-scan and aggregate
-    
     def export_to_postgres(self):
         """Export aggregated data to PostgreSQL."""
-        if not self.aggregator:
+        if not self.aggregator or not self.last_results:
             QMessageBox.warning(self, "Warning", "Please scan plugins first.")
             return
+        if "postgres_file" not in self.last_results:
+            QMessageBox.warning(self, "Warning", "Please aggregate data first.")
+            return
         
         connection_string = self.postgres_input.text()
         if not connection_string:
             QMessageBox.warning(self, "Warning", "Please enter PostgreSQL connection string.")
             return
         
-        # Get last aggregated data
-        # In real implementation, would load from saved file
-        QMessageBox.information(
-            self,
-            "Export",
-            "PostgreSQL export functionality will be implemented.\n"
-            "This will write all aggregated data to the theophysics database."
+        self.export_btn.setEnabled(False)
+        self.results_text.append("Exporting to PostgreSQL...")
+        self.db_runner.submit(
+            self.aggregator.export_file_to_postgres,
+            Path(self.last_results["postgres_file"]),
+            connection_string,
+            on_done=self.on_export_finished
         )
     
+    def on_export_finished(self, ok: bool, error: str):
+        """Handle export completion."""
+        self.export_btn.setEnabled(True)
+        if ok:
+            self.results_text.append("Export complete.")
+        else:
+            QMessageBox.critical(self, "Error", f"PostgreSQL export failed.\n{error}".rstrip())
+    
     def update_progress(self, message: str):
         """Update progress message."""
         self.results_text.append(message)
     
+    def on_scan_finished(self, results: dict):
+        """Keep the scan so a retry after a failed aggregation can reuse it."""
+        self.last_results = results
+    
     def on_aggregation_finished(self, results: dict):
         """Handle aggregation completion."""
         self.progress_bar.setVisible(False)
+        self.last_results = results
         
         # Update results table
         self.results_table.setRowCount(len(results.get("plugins", {})))
@@ -8,19 +8,46 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTextEdit, QMessageBox, QGroupBox, QSpinBox, QCheckBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThread, Signal
 from typing import TYPE_CHECKING
 
+from core.postgres_manager import PSYCOPG2_AVAILABLE
+from ui.db_task_runner import DbTaskRunner
+
 if TYPE_CHECKING:
     from core.postgres_manager import PostgresManager, DatabaseConfig
+    from core.obsidian_definitions_manager import ObsidianDefinitionsManager
+    from core.research_linker import ResearchLinker
+
+
+class ConnectTestWorker(QThread):
+    """Worker thread that tests the database connection off the GUI thread."""
+    finished = Signal(bool)
+    
+    def __init__(self, postgres_manager: PostgresManager):
+        super().__init__()
+        self.postgres_manager = postgres_manager
+    
+    def run(self):
+        self.finished.emit(self.postgres_manager.test_connection())
 
 
 class DatabaseTab(QWidget):
     """Tab for PostgreSQL database management."""
     
-    def __init__(self, postgres_manager: PostgresManager):
+    def __init__(
+        self,
+        postgres_manager: PostgresManager,
+        definitions_manager: ObsidianDefinitionsManager = None,
+        research_linker: ResearchLinker = None,
+        db_runner: DbTaskRunner = None
+    ):
         super().__init__()
         self.postgres_manager = postgres_manager
+        self.definitions_manager = definitions_manager
+        self.research_linker = research_linker
+        self.db_runner = db_runner or DbTaskRunner(parent=self)
+        self._connect_worker = None
         self._setup_ui()
         self._load_config()
     
@@ -83,13 +110,13 @@ class DatabaseTab(QWidget):
         
         # Buttons
         btn_layout = QHBoxLayout()
-        test_btn = QPushButton("🔍 Test Connection")
-        test_btn.clicked.connect(self._test_connection)
-        btn_layout.addWidget(test_btn)
+        self.test_btn = QPushButton("🔍 Test Connection")
+        self.test_btn.clicked.connect(self._test_connection)
+        btn_layout.addWidget(self.test_btn)
         
-        save_btn = QPushButton("💾 Save & Connect")
-        save_btn.clicked.connect(self._save_and_connect)
-        btn_layout.addWidget(save_btn)
+        self.save_btn = QPushButton("💾 Save & Connect")
+        self.save_btn.clicked.connect(self._save_and_connect)
+        btn_layout.addWidget(self.save_btn)
         conn_layout.addLayout(btn_layout)
         
         conn_group.setLayout(conn_layout)
@@ -111,13 +138,13 @@ class DatabaseTab(QWidget):
         ops_group = QGroupBox("Database Operations")
         ops_layout = QVBoxLayout()
         
-        sync_defs_btn = QPushButton("🔄 Sync Definitions to Database")
-        sync_defs_btn.clicked.connect(self._sync_definitions)
-        ops_layout.addWidget(sync_defs_btn)
+        self.sync_defs_btn = QPushButton("🔄 Sync Definitions to Database")
+        self.sync_defs_btn.clicked.connect(self._sync_definitions)
+        ops_layout.addWidget(self.sync_defs_btn)
         
-        sync_links_btn = QPushButton("🔄 Sync Research Links to Database")
-        sync_links_btn.clicked.connect(self._sync_research_links)
-        ops_layout.addWidget(sync_links_btn)
+        self.sync_links_btn = QPushButton("🔄 Sync Research Links to Database")
+        self.sync_links_btn.clicked.connect(self._sync_research_links)
+        ops_layout.addWidget(self.sync_links_btn)
         
         ops_group.setLayout(ops_layout)
         layout.addWidget(ops_group)
@@ -133,12 +160,39 @@ class DatabaseTab(QWidget):
         self.user_input.setText(config.user)
         # Don't load password for security
     
+    def _check_driver(self) -> bool:
+        """Warn and return False if psycopg2 is missing."""
+        if PSYCOPG2_AVAILABLE:
+            return True
+        QMessageBox.warning(self, "Error", "psycopg2 not installed.\nInstall with: pip install psycopg2-binary")
+        return False
+    
+    def _start_connection_test(self, on_finished) -> None:
+        """Apply the UI config and test it on a worker thread."""
+        self.postgres_manager.config = self._get_config()
+        
+        self.test_btn.setEnabled(False)
+        self.save_btn.setEnabled(False)
+        
+        self._connect_worker = ConnectTestWorker(self.postgres_manager)
+        self._connect_worker.finished.connect(on_finished)
+        self._connect_worker.start()
+    
+    def _on_connection_test_done(self) -> None:
+        """Re-enable the connection buttons."""
+        self.test_btn.setEnabled(True)
+        self.save_btn.setEnabled(True)
+    
     def _test_connection(self) -> None:
         """Test database connection."""
-        config = self._get_config()
-        self.postgres_manager.config = config
-        
-        if self.postgres_manager.test_connection():
+        if not self._check_driver():
+            return
+        self._start_connection_test(self._on_test_finished)
+    
+    def _on_test_finished(self, ok: bool) -> None:
+        """Handle test connection result."""
+        self._on_connection_test_done()
+        if ok:
             self.status_text.append("✅ Connection successful!")
             QMessageBox.information(self, "Success", "Database connection successful!")
         else:
@@ -147,13 +201,17 @@ class DatabaseTab(QWidget):
     
     def _save_and_connect(self) -> None:
         """Save configuration and connect."""
-        config = self._get_config()
-        self.postgres_manager.config = config
+        if not self._check_driver():
+            return
+        self._start_connection_test(self._on_save_finished)
         
         # Save to settings (you'd implement this)
         self.status_text.append("💾 Configuration saved.")
-        
-        if self.postgres_manager.test_connection():
+    
+    def _on_save_finished(self, ok: bool) -> None:
+        """Handle save & connect result."""
+        self._on_connection_test_done()
+        if ok:
             self.status_text.append("✅ Connected to database.")
             QMessageBox.information(self, "Success", "Connected to database!")
         else:
@@ -172,11 +230,74 @@ class DatabaseTab(QWidget):
     
     def _sync_definitions(self) -> None:
         """Sync definitions to database."""
-        QMessageBox.information(self, "Info", "This will sync all definitions to PostgreSQL.")
-        # Implementation would go here
+        if not self._check_driver():
+            return
+        
+        definitions = self.definitions_manager.get_all_definitions() if self.definitions_manager else []
+        if not definitions:
+            self.status_text.append("ℹ️ No definitions to sync.")
+            return
+        
+        rows = [
+            {
+                "phrase": d.phrase,
+                "definition": d.definition,
+                "aliases": d.aliases,
+                "classification": d.classification,
+                "folder": d.folder
+            }
+            for d in definitions
+        ]
+        
+        self.sync_defs_btn.setEnabled(False)
+        self.status_text.append(f"🔄 Syncing {len(rows)} definitions...")
+        self.db_runner.submit(
+            self.postgres_manager.save_definitions_bulk, rows,
+            on_done=self._on_definitions_synced
+        )
+    
+    def _on_definitions_synced(self, ok: bool, error: str) -> None:
+        """Handle definitions sync result."""
+        self.sync_defs_btn.setEnabled(True)
+        if ok:
+            self.status_text.append("✅ Definitions synced.")
+        else:
+            self.status_text.append(f"❌ Definitions sync failed. {error}".rstrip())
     
     def _sync_research_links(self) -> None:
         """Sync research links to database."""
-        QMessageBox.information(self, "Info", "This will sync all research links to PostgreSQL.")
-        # Implementation would go here
+        if not self._check_driver():
+            return
+        
+        custom_links = self.research_linker.custom_links if self.research_linker else {}
+        if not custom_links:
+            self.status_text.append("ℹ️ No research links to sync.")
+            return
+        
+        priority = {source: i for i, source in enumerate(self.research_linker.get_priority_order())}
+        rows = [
+            {
+                "term": term,
+                "source": source,
+                "url": url,
+                "priority": priority.get(source, len(priority))
+            }
+            for term, links in custom_links.items()
+            for source, url in links.items()
+        ]
+        
+        self.sync_links_btn.setEnabled(False)
+        self.status_text.append(f"🔄 Syncing {len(rows)} research links...")
+        self.db_runner.submit(
+            self.postgres_manager.save_research_links_bulk, rows,
+            on_done=self._on_research_links_synced
+        )
+    
+    def _on_research_links_synced(self, ok: bool, error: str) -> None:
+        """Handle research links sync result."""
+        self.sync_links_btn.setEnabled(True)
+        if ok:
+            self.status_text.append("✅ Research links synced.")
+        else:
+            self.status_text.append(f"❌ Research links sync failed. {error}".rstrip())
 
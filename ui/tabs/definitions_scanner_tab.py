@@ -5,243 +5,934 @@ Integrates with Definition Engine for Wikipedia auto-fill.
 
 from __future__ import annotations
 
+import heapq
+import json
+import logging
+import mmap
+import operator
+import os
 import re
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, TYPE_CHECKING
+from typing import Iterator, List, Dict, Optional, TYPE_CHECKING
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox,
-    QMessageBox, QSplitter, QListWidget, QListWidgetItem,
+    QMessageBox, QSplitter, QListView,
     QTextEdit, QLineEdit, QComboBox, QProgressBar, QCheckBox,
     QScrollArea, QFrame
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QTimer, QObject, QRunnable, QThreadPool, QProcess,
+    QAbstractListModel, QModelIndex
+)
 from PySide6.QtGui import QColor
+import yaml
 
 if TYPE_CHECKING:
     from core.obsidian_definitions_manager import ObsidianDefinitionsManager
 
 
-@dataclass
+# Every section marker in a single alternation, compiled once and shared by
+# every scan, so each file is searched in one pass. Group names map to the
+# section(s) a marker flags; the numbered/unnumbered header variants of a
+# section are folded into one group.
+_SECTION_MARKERS = re.compile('|'.join(
+    f'(?P<{name}>{pattern})' for name, pattern in (
+        ('aliases', r'## (?:1\. )?aliases'),
+        ('aliases_key', r'aliases:'),
+        ('core', r'## (?:[12]\. )?core definition'),
+        # Legacy layout: "## 2. Ontological Category" flags both sections
+        ('operational_ontological', r'## 2\. ontological category'),
+        ('operational', r'## (?:3\. )?operational definition'),
+        ('ontological', r'## (?:4\. )?ontological context|## 3\. logical dependencies|ontological category'),
+        ('relationships', r'## (?:5\. )?relationships|## 4\. crosslinks|\| relation type \|'),
+        ('scientific', r'## (?:6\. )?scientific definition|## 5\. mathematical formalization'),
+        ('narrative', r'## (?:7\. )?narrative definition|## 6\. theological mapping|## 7\. practical application'),
+        ('metadata', r'## metadata|tags:|#glossary|#theophysics'),
+    )
+), re.IGNORECASE)
+# Bytes mirror of the markers, searched directly against mmapped large files
+_SECTION_MARKERS_BYTES = re.compile(_SECTION_MARKERS.pattern.encode('ascii'), re.IGNORECASE)
+
+
+# Completeness buckets indexed by score // 25 (scores are multiples of 100/8)
+_BUCKETS = ('0-24%', '25-49%', '50-74%', '75-99%', '100%')
+# Bytes read up front to decide whether a file is a definition at all
+_HEAD_BYTES = 4096
+# Files above this size are matched through mmap instead of being decoded
+_MMAP_THRESHOLD = 64 * 1024
+# Early-exit heuristic: marks a file as a definition note
+_TYPE_DEF_RE = re.compile(r'type: definition|## core definition', re.IGNORECASE)
+_FRONTMATTER_RE = re.compile(r'\A---[ \t]*\r?\n(.*?)\r?\n---', re.DOTALL)
+_FRONTMATTER_RE_BYTES = re.compile(_FRONTMATTER_RE.pattern.encode('ascii'), re.DOTALL)
+_TERM_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_TERM_RE_BYTES = re.compile(_TERM_RE.pattern.encode('ascii'), re.MULTILINE)
+# key: value lines, for frontmatter that is not valid YAML
+_FM_KV = re.compile(r'^([^:\n]+):[ \t]*(.*)$', re.MULTILINE)
+# libyaml-backed loader when available
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# file path -> (st_mtime_ns, st_size, validation or None for non-definitions)
+_VALIDATION_CACHE: Dict[str, tuple] = {}
+# Pool jobs read and write the cache concurrently; every access holds this
+_VALIDATION_CACHE_LOCK = threading.Lock()
+# Validation errors are rate limited per exception type; a corrupted folder
+# would otherwise log one line per file from every pool thread
+_log = logging.getLogger(__name__)
+_MAX_ERRORS_PER_KIND = 5
+_ERROR_COUNTS: Counter = Counter()
+_ERROR_LOCK = threading.Lock()
+# Per-folder copy of the cache so a fresh session only revalidates changed files
+_CACHE_FILENAME = '.scanner_cache.json'
+_CACHE_VERSION = 2
+
+
+def _parse_frontmatter(content: str) -> Dict:
+    """Parse the YAML frontmatter block at the top of content."""
+    match = _FRONTMATTER_RE.match(content)
+    return _load_frontmatter(match.group(1)) if match else {}
+
+
+def _load_frontmatter(fm_text: str) -> Dict:
+    """Load a frontmatter block's text into a dict."""
+    try:
+        data = yaml.load(fm_text, Loader=_YAML_LOADER)
+    except yaml.YAMLError:
+        # Hand-edited notes often have invalid YAML; fall back to key: value lines
+        data = {k.strip(): v.strip() for k, v in _FM_KV.findall(fm_text)}
+    return data if isinstance(data, dict) else {}
+
+
+def _flag(mask: int) -> property:
+    """Boolean property backed by one bit of DefinitionValidation.flags."""
+    def getter(self) -> bool:
+        return bool(self.flags & mask)
+    
+    def setter(self, value: bool) -> None:
+        if value:
+            self.flags |= mask
+        else:
+            self.flags &= ~mask
+    
+    return property(getter, setter)
+
+
+# Completeness score for every possible 8-bit section bitfield
+_SCORE_TABLE = tuple(bin(flags).count('1') * 100 // 8 for flags in range(256))
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_DATACLASS_OPTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTS)
 class DefinitionValidation:
     """Validation result for a single definition."""
     file_path: str
     term: str
-    has_aliases: bool = False
-    has_core_definition: bool = False
-    has_operational_definition: bool = False
-    has_ontological_context: bool = False
-    has_relationships: bool = False
-    has_scientific_definition: bool = False
-    has_narrative_definition: bool = False
-    has_metadata: bool = False
-    
-    # Raw content for editing
-    raw_content: str = ""
+    # Bitfield of the template sections present (see the masks below)
+    flags: int = 0
     frontmatter: Dict = field(default_factory=dict)
     
+    ALIASES = 1 << 0
+    CORE = 1 << 1
+    OPERATIONAL = 1 << 2
+    ONTOLOGICAL = 1 << 3
+    RELATIONSHIPS = 1 << 4
+    SCIENTIFIC = 1 << 5
+    NARRATIVE = 1 << 6
+    METADATA = 1 << 7
+    ALL_SECTIONS = (1 << 8) - 1
+    
+    SECTIONS = (
+        (ALIASES, "Aliases"),
+        (CORE, "Core Definition"),
+        (OPERATIONAL, "Operational Definition"),
+        (ONTOLOGICAL, "Ontological Context"),
+        (RELATIONSHIPS, "Relationships"),
+        (SCIENTIFIC, "Scientific Definition"),
+        (NARRATIVE, "Narrative Definition"),
+        (METADATA, "Metadata"),
+    )
+    
+    has_aliases = _flag(ALIASES)
+    has_core_definition = _flag(CORE)
+    has_operational_definition = _flag(OPERATIONAL)
+    has_ontological_context = _flag(ONTOLOGICAL)
+    has_relationships = _flag(RELATIONSHIPS)
+    has_scientific_definition = _flag(SCIENTIFIC)
+    has_narrative_definition = _flag(NARRATIVE)
+    has_metadata = _flag(METADATA)
+    
     @property
     def completeness_score(self) -> int:
         """Calculate completeness percentage (0-100)."""
-        fields = [
-            self.has_aliases,
-            self.has_core_definition,
-            self.has_operational_definition,
-            self.has_ontological_context,
-            self.has_relationships,
-            self.has_scientific_definition,
-            self.has_narrative_definition,
-            self.has_metadata
-        ]
-        return int(sum(fields) / len(fields) * 100)
+        return _SCORE_TABLE[self.flags]
     
     @property
     def missing_sections(self) -> List[str]:
         """Get list of missing sections."""
-        missing = []
-        if not self.has_aliases:
-            missing.append("Aliases")
-        if not self.has_core_definition:
-            missing.append("Core Definition")
-        if not self.has_operational_definition:
-            missing.append("Operational Definition")
-        if not self.has_ontological_context:
-            missing.append("Ontological Context")
-        if not self.has_relationships:
-            missing.append("Relationships")
-        if not self.has_scientific_definition:
-            missing.append("Scientific Definition")
-        if not self.has_narrative_definition:
-            missing.append("Narrative Definition")
-        if not self.has_metadata:
-            missing.append("Metadata")
-        return missing
-
-
-class DefinitionScannerThread(QThread):
-    """Background thread for scanning definitions."""
+        return [name for mask, name in self.SECTIONS if not self.flags & mask]
+
+
+def _load_validation_cache(folder: Path) -> None:
+    """Seed _VALIDATION_CACHE from the folder's persisted cache file."""
+    cache_file = folder / _CACHE_FILENAME
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        _log.warning("Ignoring scanner cache %s: %s", cache_file, e)
+        return
+    
+    if not isinstance(data, dict) or data.get('version') != _CACHE_VERSION:
+        return
+    
+    # A hand-edited or truncated cache is discarded whole, not half-loaded
+    loaded = {}
+    try:
+        for path, (mtime_ns, size, entry) in data.get('files', {}).items():
+            # Bad values would only fail later on the GUI thread; drop them
+            if not (isinstance(mtime_ns, int) and isinstance(size, int)):
+                continue
+            validation = None
+            if entry is not None:
+                flags = entry['flags']
+                if not (isinstance(flags, int)
+                        and 0 <= flags <= DefinitionValidation.ALL_SECTIONS
+                        and isinstance(entry['term'], str)
+                        and isinstance(entry.get('frontmatter', {}), dict)):
+                    continue
+                validation = DefinitionValidation(
+                    file_path=path,
+                    term=entry['term'],
+                    flags=entry['flags'],
+                    frontmatter=entry.get('frontmatter', {})
+                )
+            loaded[path] = (mtime_ns, size, validation)
+    except (AttributeError, TypeError, ValueError, KeyError) as e:
+        _log.warning("Ignoring malformed scanner cache %s: %r", cache_file, e)
+        return
+    
+    with _VALIDATION_CACHE_LOCK:
+        # Entries validated in this session are newer than the file's
+        for path, cached in loaded.items():
+            _VALIDATION_CACHE.setdefault(path, cached)
+
+
+def _save_validation_cache(folder: Path, md_files: List[Path]) -> None:
+    """Persist cache entries for md_files and forget files that are gone."""
+    live = {str(p) for p in md_files}
+    prefix = os.path.join(str(folder), "")
+    with _VALIDATION_CACHE_LOCK:
+        for path in [p for p in _VALIDATION_CACHE if p.startswith(prefix) and p not in live]:
+            del _VALIDATION_CACHE[path]
+        snapshot = {path: _VALIDATION_CACHE[path] for path in live if path in _VALIDATION_CACHE}
+    
+    files = {}
+    for path, (mtime_ns, size, validation) in snapshot.items():
+        entry = None
+        if validation is not None:
+            entry = {
+                'term': validation.term,
+                'flags': validation.flags,
+                'frontmatter': validation.frontmatter
+            }
+        files[path] = (mtime_ns, size, entry)
+    
+    cache_file = folder / _CACHE_FILENAME
+    tmp_file = cache_file.with_suffix('.tmp')
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': _CACHE_VERSION, 'files': files}, f, default=str)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        _log.warning("Could not write scanner cache %s: %s", cache_file, e)
+
+
+# Marker group -> DefinitionValidation bits it sets. A bare "aliases:" key
+# only counts once the frontmatter value is checked, so it gets its own bit
+# above the eight section bits.
+_ALIASES_KEY = 1 << 8
+_MARKER_BITS = {
+    'aliases': DefinitionValidation.ALIASES,
+    'aliases_key': _ALIASES_KEY,
+    'core': DefinitionValidation.CORE,
+    'operational_ontological': DefinitionValidation.OPERATIONAL | DefinitionValidation.ONTOLOGICAL,
+    'operational': DefinitionValidation.OPERATIONAL,
+    'ontological': DefinitionValidation.ONTOLOGICAL,
+    'relationships': DefinitionValidation.RELATIONSHIPS,
+    'scientific': DefinitionValidation.SCIENTIFIC,
+    'narrative': DefinitionValidation.NARRATIVE,
+    'metadata': DefinitionValidation.METADATA,
+}
+_ALL_MARKER_BITS = DefinitionValidation.ALL_SECTIONS | _ALIASES_KEY
+
+
+def _scan_sections(content, markers=_SECTION_MARKERS) -> int:
+    """OR together the bits of every section marker found in content."""
+    bits = 0
+    for match in markers.finditer(content):
+        bits |= _MARKER_BITS[match.lastgroup]
+        if bits == _ALL_MARKER_BITS:
+            break
+    return bits
+
+
+def _iter_md(root: Path, recursive: bool) -> Iterator[Path]:
+    """Yield markdown files under root using os.scandir's cached entry types."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.md') and entry.is_file():
+                    yield Path(entry.path)
+
+
+def _log_validation_error(file_path: Path, error: Exception) -> None:
+    """Log a per-file failure, capping repeats of the same error type per scan."""
+    kind = type(error).__name__
+    with _ERROR_LOCK:
+        _ERROR_COUNTS[kind] += 1
+        seen = _ERROR_COUNTS[kind]
+    if seen <= _MAX_ERRORS_PER_KIND:
+        _log.warning("validate failed: %s: %s", file_path, error)
+        if seen == _MAX_ERRORS_PER_KIND:
+            _log.warning("further %s errors suppressed for this scan", kind)
+
+
+def _reset_validation_errors() -> None:
+    """Start a fresh error budget for a new scan."""
+    with _ERROR_LOCK:
+        _ERROR_COUNTS.clear()
+
+
+def _validate_definition_file(file_path: Path) -> Optional[DefinitionValidation]:
+    """Validate a single definition file, reusing the cached result if unchanged."""
+    try:
+        st = file_path.stat()
+    except OSError as e:
+        _log_validation_error(file_path, e)
+        return None
+    
+    key = str(file_path)
+    with _VALIDATION_CACHE_LOCK:
+        cached = _VALIDATION_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    validation = _validate_definition_content(file_path)
+    with _VALIDATION_CACHE_LOCK:
+        _VALIDATION_CACHE[key] = (st.st_mtime_ns, st.st_size, validation)
+    return validation
+
+
+def _validate_definition_content(file_path: Path) -> Optional[DefinitionValidation]:
+    """Validate a single definition file against template."""
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(_HEAD_BYTES)
+            
+            # Skip non-definition files using only the head of the file
+            head_text = head.decode('utf-8', errors='ignore')
+            if not _TYPE_DEF_RE.search(head_text):
+                # Check if it looks like a definition anyway
+                if '# ' not in head_text:
+                    return None
+            
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                # Large file: match the bytes in place, decoding only the
+                # heading and frontmatter
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    term_match = _TERM_RE_BYTES.search(mm)
+                    term = (term_match.group(1).decode('utf-8', errors='replace').strip()
+                            if term_match else file_path.stem)
+                    fm_match = _FRONTMATTER_RE_BYTES.match(mm)
+                    frontmatter = _load_frontmatter(fm_match.group(1).decode('utf-8')) if fm_match else {}
+                    bits = _scan_sections(mm, _SECTION_MARKERS_BYTES)
+            else:
+                content = (head + f.read()).decode('utf-8')
+                
+                # Extract term name from first heading or filename
+                term_match = _TERM_RE.search(content)
+                term = term_match.group(1).strip() if term_match else file_path.stem
+                frontmatter = _parse_frontmatter(content)
+                
+                # Check for each section in one pass over the content
+                bits = _scan_sections(content)
+        
+        flags = bits & DefinitionValidation.ALL_SECTIONS
+        # As before YAML parsing: only a missing key or an empty list means no
+        # aliases; a bare "aliases:" still counts
+        if bits & _ALIASES_KEY and frontmatter.get('aliases', '[]') not in ('[]', []):
+            flags |= DefinitionValidation.ALIASES
+        
+        return DefinitionValidation(
+            file_path=str(file_path),
+            term=term,
+            flags=flags,
+            frontmatter=frontmatter
+        )
+        
+    except Exception as e:
+        _log_validation_error(file_path, e)
+        return None
+
+
+def _count_missing_sections(flags: array) -> Dict[str, int]:
+    """Count, per section, how many bitfields lack it."""
+    # At most 256 distinct bitfields, so this is independent of file count
+    histogram = Counter(flags)
+    counts = {}
+    for mask, name in DefinitionValidation.SECTIONS:
+        missing = sum(n for value, n in histogram.items() if not value & mask)
+        if missing:
+            counts[name] = missing
+    return counts
+
+
+# Template sections that "Fill from Wikipedia" may populate, keyed by the
+# section names returned by fill_single_term_from_wikipedia
+_SECTION_PATTERNS = {
+    key: re.compile(rf'(## {header}.*?)(\n## |\n---|\Z)', re.DOTALL | re.IGNORECASE)
+    for key, header in (
+        ('core', r'2\. Core Definition'),
+        ('scientific', r'6\. Scientific Definition'),
+        ('operational', r'3\. Operational Definition'),
+        ('ontology', r'4\. Ontological Context'),
+        ('narrative', r'7\. Narrative Definition'),
+    )
+}
+# A line with real content, i.e. not blank and not an HTML comment
+_CONTENT_LINE = re.compile(r'^[^\S\n]*(?!<!--)\S', re.MULTILINE)
+
+
+# Full 7-layer definition note, filled in with .format(term=...)
+_DEFINITION_TEMPLATE = '''---
+aliases: []
+uuid:
+title: {term}
+author: David Lowe
+type: definition
+created: 
+updated: 
+status: draft
+category:
+pillars: []
+---
+
+# {term}
+
+## 1. Aliases
+<!-- Semantic anchoring: other names, symbols, abbreviations -->
+
+
+## 2. Core Definition
+<!-- ONE SENTENCE. Immutable. What the term IS, not what it implies. This NEVER changes. -->
+
+
+## 3. Operational Definition
+<!-- How this term FUNCTIONS within the Theophysics framework. This layer evolves with new discoveries. -->
+
+
+## 4. Ontological Context
+<!-- Where does this term sit in the framework? Choose primary domain(s): -->
+<!-- - Trinity-Mechanics -->
+<!-- - Logos-Information -->
+<!-- - Observer-Consciousness -->
+<!-- - Quantum-Collapse -->
+<!-- - Moral-Geometry -->
+<!-- - Cosmological-Structure -->
+
+
+## 5. Relationships
+<!-- Forms the coherence network. Link to related terms. -->
+| Relation Type | Term |
+|---------------|------|
+| Parent | |
+| Children | |
+| Prerequisites | |
+| See Also | |
+| Contrasts With | |
+
+
+## 6. Scientific Definition
+<!-- Textbook/standard physics definition. Neutral grounding for defensibility. -->
+
+
+## 7. Narrative Definition
+<!-- Intuitive explanation for teaching. Analogies welcome here. -->
+
+
+---
+## Metadata
+
+**Related Terms:**
+**Prerequisites:**
+**Used In Papers:**
+**Tags:** #glossary #theophysics
+'''
+
+
+# List row styles, lowest band first, and the band for every possible
+# section bitfield (<50%, 50-74%, 75-99%, 100%)
+_ICONS = ("🔴", "🟠", "🟡", "✅")
+_COLORS = (QColor(200, 100, 100), QColor(200, 150, 100), QColor(200, 200, 100), QColor(100, 200, 100))
+_STYLE_BANDS = bytes(
+    (score >= 50) + (score >= 75) + (score == 100) for score in _SCORE_TABLE
+)
+
+
+class ValidationListModel(QAbstractListModel):
+    """
+    List model over scan results, sorted by completeness (lowest first).
+    
+    The rows for every filter are computed once per scan, so switching
+    filters only swaps which precomputed index list is shown.
+    """
+    
+    # Filter modes, in the order of the scanner tab's filter combo
+    INCOMPLETE, COMPLETE, ALL, MISSING_CORE, MISSING_RELATIONSHIPS = range(5)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[DefinitionValidation] = []
+        # Columns parallel to _items, so painting and filtering never go
+        # through DefinitionValidation properties
+        self._terms: List[str] = []
+        self._flags = array('B')
+        self._scores = array('B')
+        self._bands = array('B')
+        self._filter_rows: Dict[int, List[int]] = {mode: [] for mode in range(5)}
+        self._mode = self.INCOMPLETE
+        self._rows: List[int] = self._filter_rows[self._mode]
+    
+    def set_validations(self, validations: List[DefinitionValidation]) -> None:
+        """Replace the model contents."""
+        self.beginResetModel()
+        flags = [v.flags for v in validations]
+        scores = array('B', [_SCORE_TABLE[f] for f in flags])
+        order = sorted(range(len(validations)), key=scores.__getitem__)
+        self._items = [validations[i] for i in order]
+        self._terms = [v.term for v in self._items]
+        self._flags = array('B', [flags[i] for i in order])
+        self._scores = array('B', [scores[i] for i in order])
+        self._bands = array('B', [_STYLE_BANDS[f] for f in self._flags])
+        
+        rows = {mode: [] for mode in range(5)}
+        for idx, flags in enumerate(self._flags):
+            self._add_to_filters(rows, idx, flags)
+        self._filter_rows = rows
+        self._rows = rows[self._mode]
+        self.endResetModel()
+    
+    def append_validations(self, validations: List[DefinitionValidation]) -> None:
+        """
+        Add a batch of results at the end, unsorted.
+        
+        Used while a scan is still running; set_validations() with the
+        full results puts everything in order afterwards.
+        """
+        if not validations:
+            return
+        start = len(self._items)
+        new_rows = {mode: [] for mode in range(5)}
+        for offset, v in enumerate(validations):
+            self._add_to_filters(new_rows, start + offset, v.flags)
+        
+        # New indices are the largest, so visible rows only grow at the end
+        visible = len(self._rows)
+        added = len(new_rows[self._mode])
+        if added:
+            self.beginInsertRows(QModelIndex(), visible, visible + added - 1)
+        self._items.extend(validations)
+        self._terms.extend(v.term for v in validations)
+        flags = [v.flags for v in validations]
+        self._flags.extend(flags)
+        self._scores.extend(_SCORE_TABLE[f] for f in flags)
+        self._bands.extend(_STYLE_BANDS[f] for f in flags)
+        for mode, rows in new_rows.items():
+            self._filter_rows[mode].extend(rows)
+        if added:
+            self.endInsertRows()
+    
+    def _add_to_filters(self, rows: Dict[int, List[int]], idx: int, flags: int) -> None:
+        """Append item idx to the row list of every filter it passes."""
+        rows[self.ALL].append(idx)
+        if flags == DefinitionValidation.ALL_SECTIONS:
+            rows[self.COMPLETE].append(idx)
+        else:
+            rows[self.INCOMPLETE].append(idx)
+        if not flags & DefinitionValidation.CORE:
+            rows[self.MISSING_CORE].append(idx)
+        if not flags & DefinitionValidation.RELATIONSHIPS:
+            rows[self.MISSING_RELATIONSHIPS].append(idx)
+    
+    def replace_validation(self, old: Optional[DefinitionValidation],
+                           new: Optional[DefinitionValidation]) -> None:
+        """
+        Swap one item for its revalidated result.
+        
+        If its section flags are unchanged the row keeps its place and only
+        that row is repainted; otherwise sorting and filters are rebuilt.
+        """
+        idx = next((i for i, v in enumerate(self._items) if v is old), None)
+        if idx is None or new is None or new.flags != old.flags:
+            items = [v for v in self._items if v is not old]
+            if new is not None:
+                items.append(new)
+            self.set_validations(items)
+            return
+        
+        self._items[idx] = new
+        self._terms[idx] = new.term
+        # Filter row lists are ascending item indices
+        pos = bisect_left(self._rows, idx)
+        if pos < len(self._rows) and self._rows[pos] == idx:
+            model_index = self.index(pos)
+            self.dataChanged.emit(model_index, model_index)
+    
+    def set_filter(self, mode: int) -> None:
+        """Show the precomputed rows for a filter mode."""
+        self.beginResetModel()
+        self._mode = mode
+        self._rows = self._filter_rows.get(mode, [])
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        idx = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{_ICONS[self._bands[idx]]} {self._terms[idx]} ({self._scores[idx]}%)"
+        if role == Qt.ForegroundRole:
+            return _COLORS[self._bands[idx]]
+        if role == Qt.UserRole:
+            # Item index only; validation() hands out the object itself
+            return idx
+        return None
+    
+    def validation(self, index: QModelIndex) -> Optional[DefinitionValidation]:
+        """The validation shown at a view index, fetched without Qt variants."""
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        return self._items[self._rows[index.row()]]
+
+
+def _aggregate_results(validations: List[Optional[DefinitionValidation]]) -> dict:
+    """Build the scan summary from per-file validations, in file order."""
+    results = {
+        'total_files': 0,
+        'total_definitions': 0,
+        'complete_definitions': 0,
+        'incomplete_definitions': 0,
+        'average_completeness': 0.0,
+        'validations': [],
+        'by_completeness': {
+            '100%': [],
+            '75-99%': [],
+            '50-74%': [],
+            '25-49%': [],
+            '0-24%': []
+        },
+        'missing_sections_count': {}
+    }
+    # Section bitfields of every definition, one byte each
+    flags = array('B')
+    sum_scores = 0
+    
+    for validation in validations:
+        if not validation:
+            continue
+        
+        results['total_files'] += 1
+        results['total_definitions'] += 1
+        results['validations'].append(validation)
+        
+        # Categorize by completeness
+        score = validation.completeness_score
+        sum_scores += score
+        if score == 100:
+            results['complete_definitions'] += 1
+        results['by_completeness'][_BUCKETS[score // 25]].append(validation)
+        flags.append(validation.flags)
+    
+    results['incomplete_definitions'] = (
+        results['total_definitions'] - results['complete_definitions']
+    )
+    results['average_completeness'] = sum_scores / max(results['total_definitions'], 1)
+    results['missing_sections_count'] = _count_missing_sections(flags)
+    return results
+
+
+class _ScanSignals(QObject):
+    """Signals for the scan jobs (QRunnable is not a QObject)."""
+    listed = Signal(object)          # list of markdown Paths
+    batch = Signal(object)           # definitions validated so far in a chunk
+    partial = Signal(int, object)    # chunk offset, validations
+
+
+class _ListFilesJob(QRunnable):
+    """Load the persisted cache and list the folder's markdown files."""
+    
+    def __init__(self, folder: Path, recursive: bool, signals: _ScanSignals):
+        super().__init__()
+        self.folder = folder
+        self.recursive = recursive
+        self.signals = signals
+    
+    def run(self):
+        md_files = []
+        try:
+            _load_validation_cache(self.folder)
+            md_files = list(_iter_md(self.folder, self.recursive))
+        except OSError as e:
+            _log.warning("Error listing %s: %s", self.folder, e)
+        finally:
+            # The scanner waits on this signal; it must fire even on failure
+            self.signals.listed.emit(md_files)
+
+
+class ValidationJob(QRunnable):
+    """
+    Validate one chunk of files and report the chunk's results.
+    
+    Definitions found are also streamed out every BATCH_SIZE files so
+    the list can fill in while the scan runs.
+    """
+    
+    BATCH_SIZE = 100
+    
+    def __init__(self, offset: int, chunk: List[Path], signals: _ScanSignals,
+                 cancelled: threading.Event):
+        super().__init__()
+        self.offset = offset
+        self.chunk = chunk
+        self.signals = signals
+        self.cancelled = cancelled
+    
+    def run(self):
+        validations = []
+        batch = []
+        for md_file in self.chunk:
+            if self.cancelled.is_set():
+                break
+            validation = _validate_definition_file(md_file)
+            validations.append(validation)
+            if validation is not None:
+                batch.append(validation)
+            if len(validations) % self.BATCH_SIZE == 0 and batch:
+                self.signals.batch.emit(batch)
+                batch = []
+        if batch and not self.cancelled.is_set():
+            self.signals.batch.emit(batch)
+        self.signals.partial.emit(self.offset, validations)
+
+
+class _SaveCacheJob(QRunnable):
+    """Write the folder's validation cache off the GUI thread."""
+    
+    def __init__(self, folder: Path, md_files: List[Path]):
+        super().__init__()
+        self.folder = folder
+        self.md_files = md_files
+    
+    def run(self):
+        _save_validation_cache(self.folder, self.md_files)
+
+
+class DefinitionScanner(QObject):
+    """
+    Scans a definitions folder on the global QThreadPool.
+    
+    The file list is split into chunks that run as independent jobs;
+    their partial results come back on the GUI thread and are merged in
+    file order once every chunk has reported. cancel() stops the jobs at
+    the next file and suppresses the finished signal.
+    """
     progress = Signal(int, str)
+    partial_batch = Signal(list)     # definitions validated so far, unordered
     finished = Signal(dict)
     
-    def __init__(self, definitions_folder: Path, recursive: bool = True):
-        super().__init__()
+    # Chunks per pool thread; a few more than one keeps progress moving
+    # and lets fast threads pick up the slack
+    CHUNKS_PER_THREAD = 4
+    
+    def __init__(self, definitions_folder: Path, recursive: bool = True, parent=None):
+        super().__init__(parent)
         self.definitions_folder = definitions_folder
         self.recursive = recursive
+        self._pool = QThreadPool.globalInstance()
+        self._signals = _ScanSignals(self)
+        self._signals.listed.connect(self._on_listed)
+        self._signals.batch.connect(self._on_batch)
+        self._signals.partial.connect(self._on_partial)
+        self._cancelled = threading.Event()
+        self._md_files: List[Path] = []
+        self._chunks: Dict[int, list] = {}
+        self._pending = 0
+        self._done_files = 0
+        self._last_pct = -1
     
-    def run(self):
-        results = {
-            'total_files': 0,
-            'total_definitions': 0,
-            'complete_definitions': 0,
-            'incomplete_definitions': 0,
-            'validations': [],
-            'by_completeness': {
-                '100%': [],
-                '75-99%': [],
-                '50-74%': [],
-                '25-49%': [],
-                '0-24%': []
-            },
-            'missing_sections_count': {}
-        }
-        
-        # Find all definition files
-        if self.recursive:
-            md_files = list(self.definitions_folder.rglob("*.md"))
-        else:
-            md_files = list(self.definitions_folder.glob("*.md"))
+    def start(self) -> None:
+        """Begin scanning."""
+        _reset_validation_errors()
+        self._pool.start(_ListFilesJob(self.definitions_folder, self.recursive, self._signals))
+    
+    def cancel(self) -> None:
+        """Stop outstanding jobs; no finished signal is emitted."""
+        self._cancelled.set()
+    
+    def _on_listed(self, md_files: List[Path]) -> None:
+        if self._cancelled.is_set():
+            self._stop()
+            return
+        self._md_files = md_files
+        if not md_files:
+            self._finish()
+            return
         
-        total_files = len(md_files)
+        n_chunks = max(1, QThread.idealThreadCount()) * self.CHUNKS_PER_THREAD
+        size = max(1, -(-len(md_files) // n_chunks))
+        starts = range(0, len(md_files), size)
+        self._pending = len(starts)
+        for start in starts:
+            self._pool.start(ValidationJob(
+                start, md_files[start:start + size], self._signals, self._cancelled
+            ))
+    
+    def _on_batch(self, validations: list) -> None:
+        if not self._cancelled.is_set():
+            self.partial_batch.emit(validations)
+    
+    def _on_partial(self, start: int, validations: list) -> None:
+        self._pending -= 1
+        if self._cancelled.is_set():
+            if self._pending == 0:
+                self._stop()
+            return
         
-        for idx, md_file in enumerate(md_files):
-            progress_pct = int((idx / max(total_files, 1)) * 100)
-            self.progress.emit(progress_pct, f"Scanning {md_file.name}...")
-            
-            validation = self._validate_definition_file(md_file)
-            if validation:
-                results['total_files'] += 1
-                results['total_definitions'] += 1
-                results['validations'].append(validation)
-                
-                # Categorize by completeness
-                score = validation.completeness_score
-                if score == 100:
-                    results['complete_definitions'] += 1
-                    results['by_completeness']['100%'].append(validation)
-                elif score >= 75:
-                    results['by_completeness']['75-99%'].append(validation)
-                elif score >= 50:
-                    results['by_completeness']['50-74%'].append(validation)
-                elif score >= 25:
-                    results['by_completeness']['25-49%'].append(validation)
-                else:
-                    results['by_completeness']['0-24%'].append(validation)
-                
-                if score < 100:
-                    results['incomplete_definitions'] += 1
-                
-                # Count missing sections
-                for section in validation.missing_sections:
-                    results['missing_sections_count'][section] = \
-                        results['missing_sections_count'].get(section, 0) + 1
+        self._chunks[start] = validations
+        self._done_files += len(validations)
+        progress_pct = int(self._done_files / len(self._md_files) * 100)
+        if progress_pct != self._last_pct:
+            self.progress.emit(progress_pct, f"Scanned {self._done_files}/{len(self._md_files)} files...")
+            self._last_pct = progress_pct
+        
+        if self._pending == 0:
+            self._finish()
+    
+    def _finish(self) -> None:
+        ordered = [v for start in sorted(self._chunks) for v in self._chunks[start]]
+        results = _aggregate_results(ordered)
+        self._pool.start(_SaveCacheJob(self.definitions_folder, self._md_files))
         
         self.progress.emit(100, "Scan complete!")
+        self._stop()
         self.finished.emit(results)
     
-    def _validate_definition_file(self, file_path: Path) -> Optional[DefinitionValidation]:
-        """Validate a single definition file against template."""
+    def _stop(self) -> None:
+        # Every job has reported by now, so none will touch our signals
+        self.deleteLater()
+
+
+class _WriteSignals(QObject):
+    """Signals for WriteWorker."""
+    # file path, fresh validation (None if no longer a definition),
+    # error message ('' on success)
+    finished = Signal(str, object, str)
+
+
+class WriteWorker(QRunnable):
+    """
+    Write a file atomically (temp file, fsync, os.replace) off the GUI
+    thread, then revalidate just that file.
+    """
+    
+    def __init__(self, file_path: Path, text: str, signals: _WriteSignals):
+        super().__init__()
+        self.file_path = file_path
+        self.text = text
+        self.signals = signals
+    
+    def run(self):
+        tmp_path = self.file_path.with_name(f".{self.file_path.name}.tmp")
         try:
-            content = file_path.read_text(encoding='utf-8')
-            
-            # Skip non-definition files
-            if 'type: definition' not in content.lower() and '## core definition' not in content.lower():
-                # Check if it looks like a definition anyway
-                if '# ' not in content:
-                    return None
-            
-            # Extract term name from first heading or filename
-            term_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-            term = term_match.group(1).strip() if term_match else file_path.stem
-            
-            # Parse frontmatter
-            frontmatter = {}
-            if content.startswith('---'):
-                fm_end = content.find('---', 3)
-                if fm_end > 0:
-                    fm_text = content[3:fm_end]
-                    for line in fm_text.split('\n'):
-                        if ':' in line:
-                            key, val = line.split(':', 1)
-                            frontmatter[key.strip()] = val.strip()
-            
-            validation = DefinitionValidation(
-                file_path=str(file_path),
-                term=term,
-                raw_content=content,
-                frontmatter=frontmatter
-            )
-            
-            content_lower = content.lower()
-            
-            # Check for each section
-            validation.has_aliases = (
-                '## 1. aliases' in content_lower or
-                '## aliases' in content_lower or
-                'aliases:' in content_lower and frontmatter.get('aliases', '[]') != '[]'
-            )
-            
-            validation.has_core_definition = (
-                '## 2. core definition' in content_lower or
-                '## core definition' in content_lower or
-                '## 1. core definition' in content_lower
-            )
-            
-            validation.has_operational_definition = (
-                '## 3. operational definition' in content_lower or
-                '## operational definition' in content_lower or
-                '## 2. ontological category' in content_lower
-            )
-            
-            validation.has_ontological_context = (
-                '## 4. ontological context' in content_lower or
-                '## ontological context' in content_lower or
-                '## 3. logical dependencies' in content_lower or
-                'ontological category' in content_lower
-            )
-            
-            validation.has_relationships = (
-                '## 5. relationships' in content_lower or
-                '## relationships' in content_lower or
-                '## 4. crosslinks' in content_lower or
-                '| relation type |' in content_lower
-            )
-            
-            validation.has_scientific_definition = (
-                '## 6. scientific definition' in content_lower or
-                '## scientific definition' in content_lower or
-                '## 5. mathematical formalization' in content_lower
-            )
-            
-            validation.has_narrative_definition = (
-                '## 7. narrative definition' in content_lower or
-                '## narrative definition' in content_lower or
-                '## 6. theological mapping' in content_lower or
-                '## 7. practical application' in content_lower
-            )
-            
-            validation.has_metadata = (
-                '## metadata' in content_lower or
-                'tags:' in content_lower or
-                '#glossary' in content_lower or
-                '#theophysics' in content_lower
-            )
-            
-            return validation
-            
+            data = self.text.encode('utf-8')
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                # The rename must never expose a file whose data is not on disk
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.file_path)
+        except (OSError, UnicodeError) as e:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            self.signals.finished.emit(str(self.file_path), None, str(e))
+            return
+        validation = _validate_definition_file(self.file_path)
+        self.signals.finished.emit(str(self.file_path), validation, "")
+
+
+class _ReadSignals(QObject):
+    """Signals for ReadWorker."""
+    finished = Signal(str, str, str)  # file path, content, error ('' on success)
+
+
+class ReadWorker(QRunnable):
+    """Read a definition file for the editor off the GUI thread."""
+    
+    def __init__(self, file_path: Path, signals: _ReadSignals):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = signals
+    
+    def run(self):
+        try:
+            content = self.file_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            self.signals.finished.emit(str(self.file_path), "", str(e))
+            return
+        self.signals.finished.emit(str(self.file_path), content, "")
+
+
+class _WikiSignals(QObject):
+    """Signals for WikiFetchWorker."""
+    finished = Signal(str, object, str)  # term, sections dict, error ('' on success)
+
+
+class WikiFetchWorker(QRunnable):
+    """Fetch Wikipedia-generated sections for one term off the GUI thread."""
+    
+    def __init__(self, term: str, fetch, signals: _WikiSignals):
+        super().__init__()
+        self.term = term
+        self.fetch = fetch
+        self.signals = signals
+    
+    def run(self):
+        try:
+            sections = self.fetch(self.term)
         except Exception as e:
-            print(f"Error validating {file_path}: {e}")
-            return None
+            self.signals.finished.emit(self.term, None, str(e))
+            return
+        self.signals.finished.emit(self.term, sections, "")
 
 
 class DefinitionsScannerTab(QWidget):
@@ -251,8 +942,14 @@ class DefinitionsScannerTab(QWidget):
         super().__init__()
         self.definitions_manager = definitions_manager
         self.scan_results = None
-        self.scanner_thread = None
+        self.scanner = None
         self.current_validation = None
+        self._write_signals = _WriteSignals(self)
+        self._write_signals.finished.connect(self._on_save_done)
+        self._read_signals = _ReadSignals(self)
+        self._read_signals.finished.connect(self._on_content_loaded)
+        self._wiki_signals = _WikiSignals(self)
+        self._wiki_signals.finished.connect(self._on_wikipedia_data)
         self._setup_ui()
     
     def _setup_ui(self) -> None:
@@ -397,7 +1094,12 @@ class DefinitionsScannerTab(QWidget):
             "⚠️ Missing Core Definition",
             "⚠️ Missing Relationships"
         ])
-        self.filter_combo.currentIndexChanged.connect(self._apply_filter)
+        # Debounce so quickly stepping through filters re-renders once
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(50)
+        self.filter_timer.timeout.connect(self._apply_filter)
+        self.filter_combo.currentIndexChanged.connect(self.filter_timer.start)
         filter_layout.addWidget(self.filter_combo)
         layout.addLayout(filter_layout)
         
@@ -405,8 +1107,13 @@ class DefinitionsScannerTab(QWidget):
         list_label = QLabel("📋 Definitions:")
         layout.addWidget(list_label)
         
-        self.def_list = QListWidget()
-        self.def_list.itemClicked.connect(self._on_definition_selected)
+        self.def_model = ValidationListModel(self)
+        self.def_model.set_filter(self.filter_combo.currentIndex())
+        
+        self.def_list = QListView()
+        self.def_list.setUniformItemSizes(True)
+        self.def_list.setModel(self.def_model)
+        self.def_list.clicked.connect(self._on_definition_selected)
         layout.addWidget(self.def_list)
         
         return panel
@@ -577,13 +1284,22 @@ class DefinitionsScannerTab(QWidget):
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         
-        self.scanner_thread = DefinitionScannerThread(
+        # A scan still in flight (e.g. after a save) is superseded
+        if self.scanner is not None:
+            self.scanner.cancel()
+        
+        self.scanner = DefinitionScanner(
             self.definitions_folder,
-            self.recursive_cb.isChecked()
+            self.recursive_cb.isChecked(),
+            parent=self
         )
-        self.scanner_thread.progress.connect(self._on_progress)
-        self.scanner_thread.finished.connect(self._on_scan_finished)
-        self.scanner_thread.start()
+        self.scanner.progress.connect(self._on_progress)
+        self.scanner.partial_batch.connect(self._on_scan_batch)
+        self.scanner.finished.connect(self._on_scan_finished)
+        
+        # The list fills in batch by batch as the scan runs
+        self.def_model.set_validations([])
+        self.scanner.start()
     
     def _inject_templates(self) -> None:
         """Inject 7-layer template into files that don't have it."""
@@ -782,17 +1498,37 @@ class DefinitionsScannerTab(QWidget):
         """Handle progress updates."""
         self.progress_bar.setValue(progress)
     
+    def _on_scan_batch(self, validations: list) -> None:
+        """Show definitions from a running scan as they arrive."""
+        self.def_model.append_validations(validations)
+    
     def _on_scan_finished(self, results: dict) -> None:
         """Handle scan completion."""
+        self.scanner = None
         self.scan_results = results
         self.scan_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
         
-        # Update stats
+        self._show_stats(results)
+        
+        # Replace the streamed rows with the sorted results; the model
+        # precomputes every filter. Hold painting and the filter combo
+        # until the reset is complete.
+        self.def_list.setUpdatesEnabled(False)
+        self.filter_combo.blockSignals(True)
+        try:
+            self.def_model.set_validations(results['validations'])
+        finally:
+            self.filter_combo.blockSignals(False)
+            self.def_list.setUpdatesEnabled(True)
+        self.def_list.viewport().update()
+    
+    def _show_stats(self, results: dict) -> None:
+        """Show the summary statistics for scan results."""
         total = results['total_definitions']
         complete = results['complete_definitions']
         incomplete = results['incomplete_definitions']
-        avg_completeness = sum(v.completeness_score for v in results['validations']) / max(total, 1)
+        avg_completeness = results['average_completeness']
         
         stats_text = f"""📊 Scan Complete!
 
@@ -803,62 +1539,50 @@ class DefinitionsScannerTab(QWidget):
 
 Most commonly missing:"""
         
-        for section, count in sorted(results['missing_sections_count'].items(), key=lambda x: -x[1])[:5]:
+        for section, count in heapq.nlargest(
+            5, results['missing_sections_count'].items(), key=operator.itemgetter(1)
+        ):
             stats_text += f"\n• {section}: {count} definitions"
         
         self.stats_label.setText(stats_text)
-        
-        # Apply filter
-        self._apply_filter()
     
     def _apply_filter(self) -> None:
         """Apply filter to definition list."""
-        if not self.scan_results:
+        self.def_model.set_filter(self.filter_combo.currentIndex())
+    
+    def _on_definition_selected(self, index: QModelIndex) -> None:
+        """Handle definition selection."""
+        validation = self.def_model.validation(index)
+        if not validation:
             return
         
-        self.def_list.clear()
-        filter_idx = self.filter_combo.currentIndex()
+        self._show_validation(validation)
         
-        validations = self.scan_results['validations']
-        
-        if filter_idx == 0:  # Incomplete only
-            validations = [v for v in validations if v.completeness_score < 100]
-        elif filter_idx == 1:  # Complete only
-            validations = [v for v in validations if v.completeness_score == 100]
-        elif filter_idx == 3:  # Missing core definition
-            validations = [v for v in validations if not v.has_core_definition]
-        elif filter_idx == 4:  # Missing relationships
-            validations = [v for v in validations if not v.has_relationships]
-        
-        # Sort by completeness (lowest first for incomplete, highest first for complete)
-        validations.sort(key=lambda v: v.completeness_score)
-        
-        for validation in validations:
-            score = validation.completeness_score
-            if score == 100:
-                icon = "✅"
-                color = QColor(100, 200, 100)
-            elif score >= 75:
-                icon = "🟡"
-                color = QColor(200, 200, 100)
-            elif score >= 50:
-                icon = "🟠"
-                color = QColor(200, 150, 100)
-            else:
-                icon = "🔴"
-                color = QColor(200, 100, 100)
-            
-            item = QListWidgetItem(f"{icon} {validation.term} ({score}%)")
-            item.setData(Qt.UserRole, validation)
-            item.setForeground(color)
-            self.def_list.addItem(item)
+        # Results keep no file text; read it on the pool. Saving stays off
+        # until the editor holds this file's content.
+        self.save_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(
+            ReadWorker(Path(validation.file_path), self._read_signals)
+        )
     
-    def _on_definition_selected(self, item: QListWidgetItem) -> None:
-        """Handle definition selection."""
-        validation = item.data(Qt.UserRole)
-        if not validation:
+    def _on_content_loaded(self, file_path: str, content: str, error: str) -> None:
+        """Put a file read by ReadWorker into the editor."""
+        # Ignore reads for a definition that is no longer selected
+        if not self.current_validation or self.current_validation.file_path != file_path:
+            return
+        if error:
+            QMessageBox.critical(self, "Error", f"Could not read file: {error}")
             return
+        self.content_editor.setPlainText(content)
         
+        # Enable buttons
+        self.save_btn.setEnabled(True)
+        self.open_file_btn.setEnabled(True)
+        self.fill_wikipedia_btn.setEnabled(True)
+        self.fill_template_btn.setEnabled(True)
+    
+    def _show_validation(self, validation: DefinitionValidation) -> None:
+        """Show a validation's term info and section checklist."""
         self.current_validation = validation
         
         # Update term info
@@ -883,42 +1607,63 @@ Most commonly missing:"""
         self.section_checks['scientific'].setChecked(validation.has_scientific_definition)
         self.section_checks['narrative'].setChecked(validation.has_narrative_definition)
         self.section_checks['metadata'].setChecked(validation.has_metadata)
-        
-        # Load content
-        self.content_editor.setPlainText(validation.raw_content)
-        
-        # Enable buttons
-        self.save_btn.setEnabled(True)
-        self.open_file_btn.setEnabled(True)
-        self.fill_wikipedia_btn.setEnabled(True)
-        self.fill_template_btn.setEnabled(True)
     
     def _save_changes(self) -> None:
         """Save changes to the definition file."""
         if not self.current_validation:
             return
         
-        try:
-            file_path = Path(self.current_validation.file_path)
-            new_content = self.content_editor.toPlainText()
-            file_path.write_text(new_content, encoding='utf-8')
-            
-            QMessageBox.information(self, "Saved", f"Changes saved to {file_path.name}")
-            
-            # Rescan this file
+        file_path = Path(self.current_validation.file_path)
+        new_content = self.content_editor.toPlainText()
+        
+        self.save_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(WriteWorker(file_path, new_content, self._write_signals))
+    
+    def _on_save_done(self, file_path: str, validation: object, error: str) -> None:
+        """Handle a finished background save."""
+        # The user may have picked another definition while this ran; the
+        # editor and Save button then belong to that one
+        still_current = (self.current_validation is not None
+                         and self.current_validation.file_path == file_path)
+        if still_current:
+            self.save_btn.setEnabled(True)
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to save: {error}")
+            return
+        
+        QMessageBox.information(self, "Saved", f"Changes saved to {Path(file_path).name}")
+        
+        if self.scan_results is None:
             self._start_scan()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save: {e}")
+            return
+        
+        # Only the saved file changed: swap its result in place
+        validations = self.scan_results['validations']
+        old = next((v for v in validations if v.file_path == file_path), None)
+        if old is not None:
+            validations = [v for v in validations if v is not old]
+        if validation is not None:
+            validations.append(validation)
+        self.scan_results = _aggregate_results(validations)
+        self._show_stats(self.scan_results)
+        
+        self.def_model.replace_validation(old, validation)
+        if still_current and validation is not None:
+            self._show_validation(validation)
     
     def _open_in_explorer(self) -> None:
         """Open file location in explorer."""
         if not self.current_validation:
             return
         
-        import subprocess
+        # Detached argv launch: no shell parsing of the path, no waiting
         file_path = Path(self.current_validation.file_path)
-        subprocess.Popen(f'explorer /select,"{file_path}"')
+        if sys.platform == 'win32':
+            QProcess.startDetached("explorer", ["/select,", str(file_path)])
+        elif sys.platform == 'darwin':
+            QProcess.startDetached("open", ["-R", str(file_path)])
+        else:
+            QProcess.startDetached("xdg-open", [str(file_path.parent)])
     
     def _fill_from_wikipedia(self) -> None:
         """Fill missing sections from Wikipedia."""
@@ -933,14 +1678,26 @@ Most commonly missing:"""
         
         term = self.current_validation.term
         
-        # Show progress
+        # Show progress; the fetch runs on the thread pool
         self.fill_wikipedia_btn.setEnabled(False)
         self.fill_wikipedia_btn.setText("🔄 Fetching...")
+        QThreadPool.globalInstance().start(
+            WikiFetchWorker(term, fill_single_term_from_wikipedia, self._wiki_signals)
+        )
+    
+    def _on_wikipedia_data(self, term: str, sections: object, error: str) -> None:
+        """Offer the fetched Wikipedia sections for insertion into the editor."""
+        self.fill_wikipedia_btn.setEnabled(True)
+        self.fill_wikipedia_btn.setText("🌐 Fill from Wikipedia")
+        
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to fetch: {error}")
+            return
+        # The user moved on to another definition while the fetch ran
+        if not self.current_validation or self.current_validation.term != term:
+            return
         
-        # Fetch from Wikipedia
         try:
-            sections = fill_single_term_from_wikipedia(term)
-            
             # Show what was found
             preview = f"Wikipedia found for '{term}':\n\n"
             preview += f"Summary: {sections.get('external_summary', 'None')[:200]}...\n\n"
@@ -959,46 +1716,44 @@ Most commonly missing:"""
                 # Get current content and insert Wikipedia data
                 content = self.content_editor.toPlainText()
                 
-                # Insert into empty sections only
+                # Insert into empty sections only. Sections are located in the
+                # original text and spliced in together at the end.
+                spans = []
                 for section_key, section_content in sections.items():
                     if section_key == 'external_summary':
                         continue
                     
                     # Find the section header
-                    section_patterns = {
-                        'core': r'(## 2\. Core Definition.*?)(\n## |\n---|\Z)',
-                        'scientific': r'(## 6\. Scientific Definition.*?)(\n## |\n---|\Z)',
-                        'operational': r'(## 3\. Operational Definition.*?)(\n## |\n---|\Z)',
-                        'ontology': r'(## 4\. Ontological Context.*?)(\n## |\n---|\Z)',
-                        'narrative': r'(## 7\. Narrative Definition.*?)(\n## |\n---|\Z)',
-                    }
+                    pattern = _SECTION_PATTERNS.get(section_key)
+                    if not pattern:
+                        continue
+                    match = pattern.search(content)
+                    if not match:
+                        continue
                     
-                    if section_key in section_patterns:
-                        pattern = section_patterns[section_key]
-                        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-                        
-                        if match:
-                            section_text = match.group(1)
-                            # Check if section is empty (just comments)
-                            lines = [l for l in section_text.split('\n')[1:] 
-                                    if l.strip() and not l.strip().startswith('<!--')]
-                            
-                            if not lines:
-                                # Insert the content
-                                header_end = section_text.find('\n')
-                                if header_end > 0:
-                                    new_section = section_text[:header_end+1] + "\n" + section_content + "\n"
-                                    content = content.replace(section_text, new_section)
+                    section_text = match.group(1)
+                    header_end = section_text.find('\n')
+                    # Only fill sections that are empty (just comments)
+                    if header_end > 0 and not _CONTENT_LINE.search(section_text, header_end + 1):
+                        new_section = section_text[:header_end+1] + "\n" + section_content + "\n"
+                        spans.append((match.start(1), match.end(1), new_section))
+                
+                pieces = []
+                pos = 0
+                for start, end, new_section in sorted(spans):
+                    if start < pos:
+                        continue
+                    pieces.append(content[pos:start])
+                    pieces.append(new_section)
+                    pos = end
+                pieces.append(content[pos:])
+                content = ''.join(pieces)
                 
                 self.content_editor.setPlainText(content)
                 QMessageBox.information(self, "Inserted", "Wikipedia data inserted! Review and save.")
         
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to fetch: {e}")
-        
-        finally:
-            self.fill_wikipedia_btn.setEnabled(True)
-            self.fill_wikipedia_btn.setText("🌐 Fill from Wikipedia")
+            QMessageBox.critical(self, "Error", f"Failed to insert: {e}")
     
     def _insert_template(self) -> None:
         """Insert the definition template into the editor."""
@@ -1006,72 +1761,6 @@ Most commonly missing:"""
             return
         
         term = self.current_validation.term
-        
-        template = f'''---
-aliases: []
-uuid:
-title: {term}
-author: David Lowe
-type: definition
-created: 
-updated: 
-status: draft
-category:
-pillars: []
----
-
-# {term}
-
-## 1. Aliases
-<!-- Semantic anchoring: other names, symbols, abbreviations -->
-
-
-## 2. Core Definition
-<!-- ONE SENTENCE. Immutable. What the term IS, not what it implies. This NEVER changes. -->
-
-
-## 3. Operational Definition
-<!-- How this term FUNCTIONS within the Theophysics framework. This layer evolves with new discoveries. -->
-
-
-## 4. Ontological Context
-<!-- Where does this term sit in the framework? Choose primary domain(s): -->
-<!-- - Trinity-Mechanics -->
-<!-- - Logos-Information -->
-<!-- - Observer-Consciousness -->
-<!-- - Quantum-Collapse -->
-<!-- - Moral-Geometry -->
-<!-- - Cosmological-Structure -->
-
-
-## 5. Relationships
-<!-- Forms the coherence network. Link to related terms. -->
-| Relation Type | Term |
-|---------------|------|
-| Parent | |
-| Children | |
-| Prerequisites | |
-| See Also | |
-| Contrasts With | |
-
-
-## 6. Scientific Definition
-<!-- Textbook/standard physics definition. Neutral grounding for defensibility. -->
-
-
-## 7. Narrative Definition
-<!-- Intuitive explanation for teaching. Analogies welcome here. -->
-
-
----
-## Metadata
-
-**Related Terms:**
-**Prerequisites:**
-**Used In Papers:**
-**Tags:** #glossary #theophysics
-'''
-        
-        self.content_editor.setPlainText(template)
+        self.content_editor.setPlainText(_DEFINITION_TEMPLATE.format(term=term))
         QMessageBox.information(self, "Template Inserted", "Template inserted! Edit and save.")
 
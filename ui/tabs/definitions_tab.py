@@ -7,10 +7,12 @@ from __future__ import annotations
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget,
     QTableWidgetItem, QPushButton, QLineEdit, QTextEdit, QGroupBox,
-    QMessageBox, QSplitter, QHeaderView, QListWidget, QListWidgetItem,
+    QMessageBox, QSplitter, QHeaderView, QListView,
     QComboBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, Signal, QAbstractListModel, QModelIndex
+)
 
 from .base import BaseTab
 from typing import TYPE_CHECKING
@@ -19,6 +21,58 @@ if TYPE_CHECKING:
     from core.obsidian_definitions_manager import ObsidianDefinitionsManager
 
 
+class _ScanSignals(QObject):
+    """Signals for ScanWorker (QRunnable is not a QObject)."""
+    finished = Signal(object)  # list of Definition
+
+
+class DefinitionListModel(QAbstractListModel):
+    """Read-only list model over Definition objects."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._definitions: list = []
+
+    def set_definitions(self, definitions: list) -> None:
+        """Replace the model contents."""
+        self.beginResetModel()
+        self._definitions = list(definitions)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._definitions)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        def_obj = self._definitions[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return def_obj.phrase
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"Aliases: {', '.join(def_obj.aliases)}" if def_obj.aliases else None
+        if role == Qt.ItemDataRole.UserRole:
+            return def_obj
+        return None
+
+
+class ScanWorker(QRunnable):
+    """Rescan the definitions folder off the GUI thread."""
+
+    def __init__(self, definitions_manager: ObsidianDefinitionsManager, signals: _ScanSignals):
+        super().__init__()
+        self.definitions_manager = definitions_manager
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.definitions_manager.scan_definitions()
+            definitions = self.definitions_manager.get_all_definitions()
+        except Exception as e:
+            print(f"Error scanning definitions: {e}")
+            definitions = []
+        self.signals.finished.emit(definitions)
+
+
 class DefinitionsTab(BaseTab):
     """Tab for managing definitions."""
 
@@ -26,6 +80,10 @@ class DefinitionsTab(BaseTab):
         super().__init__()
         self.definitions_manager = definitions_manager
         self._current_definition = None
+        self._scan_signals = _ScanSignals(self)
+        self._scan_signals.finished.connect(self._on_scan_finished)
+        self._scan_running = False
+        self._rescan_pending = False
         self._build_ui()
         self.refresh()
 
@@ -50,15 +108,19 @@ class DefinitionsTab(BaseTab):
         list_label = QLabel("All Definitions:")
         list_layout.addWidget(list_label)
 
-        self.definitions_list = QListWidget()
-        self.definitions_list.itemSelectionChanged.connect(self._on_definition_selected)
-        self.definitions_list.itemDoubleClicked.connect(self._on_definition_selected)
+        self.definitions_model = DefinitionListModel(self)
+        self.definitions_list = QListView()
+        self.definitions_list.setUniformItemSizes(True)
+        self.definitions_list.setModel(self.definitions_model)
+        # A double-click's first press already changes the selection, so
+        # selection changes alone fill the editor
+        self.definitions_list.selectionModel().selectionChanged.connect(self._on_definition_selected)
         list_layout.addWidget(self.definitions_list)
 
         # Refresh button
-        refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.clicked.connect(self.refresh)
-        list_layout.addWidget(refresh_btn)
+        self.refresh_btn = QPushButton("🔄 Refresh")
+        self.refresh_btn.clicked.connect(self.refresh)
+        list_layout.addWidget(self.refresh_btn)
 
         # RIGHT: Definition editor
         editor_widget = QWidget()
@@ -100,6 +162,7 @@ class DefinitionsTab(BaseTab):
         self.classification_combo.setMinimumHeight(35)
         self.classification_combo.setStyleSheet("font-size: 11pt; padding: 6px;")
         classification_layout.addWidget(self.classification_combo)
+        self._classification_index = self._index_combo_items(self.classification_combo)
         editor_layout.addLayout(classification_layout)
         
         # Folder
@@ -114,6 +177,7 @@ class DefinitionsTab(BaseTab):
         self.folder_combo.setMinimumHeight(35)
         self.folder_combo.setStyleSheet("font-size: 11pt; padding: 6px;")
         folder_layout.addWidget(self.folder_combo)
+        self._folder_index = self._index_combo_items(self.folder_combo)
         editor_layout.addLayout(folder_layout)
 
         # Definition
@@ -155,24 +219,59 @@ class DefinitionsTab(BaseTab):
 
         layout.addWidget(splitter)
 
+    @staticmethod
+    def _index_combo_items(combo: QComboBox) -> dict:
+        """Map item text -> row for a combo, kept current as items change."""
+        index = {}
+
+        def rebuild(*_args):
+            index.clear()
+            index.update({combo.itemText(row): row for row in range(combo.count())})
+
+        rebuild()
+        # Editable combos gain rows when the user enters new text
+        combo.model().rowsInserted.connect(rebuild)
+        combo.model().rowsRemoved.connect(rebuild)
+        return index
+
     def refresh(self) -> None:
-        """Refresh the definitions list."""
-        self.definitions_manager.scan_definitions()
-        definitions = self.definitions_manager.get_all_definitions()
-        
-        self.definitions_list.clear()
-        for def_obj in definitions:
-            item = QListWidgetItem(def_obj.phrase)
-            item.setData(Qt.ItemDataRole.UserRole, def_obj)
-            if def_obj.aliases:
-                item.setToolTip(f"Aliases: {', '.join(def_obj.aliases)}")
-            self.definitions_list.addItem(item)
+        """Rescan definitions in the background and refresh the list."""
+        if self._scan_running:
+            # Coalesce: rescan once more when the current scan finishes
+            self._rescan_pending = True
+            return
+
+        self._scan_running = True
+        self.refresh_btn.setEnabled(False)
+        self.refresh_btn.setText("⏳ Scanning...")
+        QThreadPool.globalInstance().start(ScanWorker(self.definitions_manager, self._scan_signals))
+
+    def _on_scan_finished(self, definitions: list) -> None:
+        """Populate the list from a finished background scan."""
+        self._scan_running = False
+        self.refresh_btn.setEnabled(True)
+        self.refresh_btn.setText("🔄 Refresh")
+        if self._rescan_pending:
+            self._rescan_pending = False
+            self.refresh()
+            return
+
+        # One repaint for the whole reload, and no selection churn mid-reset
+        selection_model = self.definitions_list.selectionModel()
+        self.definitions_list.setUpdatesEnabled(False)
+        selection_model.blockSignals(True)
+        try:
+            self.definitions_model.set_definitions(definitions)
+        finally:
+            selection_model.blockSignals(False)
+            self.definitions_list.setUpdatesEnabled(True)
+        self.definitions_list.viewport().update()
 
     def _on_definition_selected(self) -> None:
         """Handle definition selection."""
-        current_item = self.definitions_list.currentItem()
-        if current_item:
-            def_obj = current_item.data(Qt.ItemDataRole.UserRole)
+        selected = self.definitions_list.selectionModel().selectedIndexes()
+        if selected:
+            def_obj = selected[0].data(Qt.ItemDataRole.UserRole)
             if def_obj:
                 self._current_definition = def_obj
                 self.phrase_edit.setText(def_obj.phrase)
@@ -180,13 +279,13 @@ class DefinitionsTab(BaseTab):
                 self.definition_edit.setPlainText(def_obj.definition)
                 # Set classification and folder if they exist
                 if hasattr(def_obj, 'classification'):
-                    index = self.classification_combo.findText(def_obj.classification)
+                    index = self._classification_index.get(def_obj.classification, -1)
                     if index >= 0:
                         self.classification_combo.setCurrentIndex(index)
                     else:
                         self.classification_combo.setCurrentText(def_obj.classification)
                 if hasattr(def_obj, 'folder'):
-                    index = self.folder_combo.findText(def_obj.folder)
+                    index = self._folder_index.get(def_obj.folder, -1)
                     if index >= 0:
                         self.folder_combo.setCurrentIndex(index)
                     else:
@@ -4,13 +4,30 @@ Footnote Tab - GUI for generating footnotes with academic and vault links.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import operator
+import os
+import re
+from dataclasses import asdict, fields
+from functools import lru_cache
+from pathlib import Path
+
 from PySide6.QtWidgets import (
+    QApplication,
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QTextEdit, QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
-    QMessageBox, QSplitter, QGroupBox, QCheckBox, QListWidget, QListWidgetItem
+    QTextEdit, QPlainTextEdit, QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
+    QMessageBox, QSplitter, QGroupBox, QCheckBox, QListView, QButtonGroup
+)
+from PySide6.QtGui import QTextCursor
+from PySide6.QtCore import (
+    Qt, QTimer, QSignalBlocker, QObject, QRunnable, QThreadPool, Signal,
+    QAbstractListModel, QModelIndex
 )
-from PySide6.QtCore import Qt
-from typing import TYPE_CHECKING
+from typing import Deque, Dict, List, Optional, TYPE_CHECKING
+from collections import deque
+
+from core.footnote_system import Footnote
 
 if TYPE_CHECKING:
     from core.footnote_system import FootnoteSystem
@@ -18,9 +35,142 @@ if TYPE_CHECKING:
     from core.obsidian_definitions_manager import ObsidianDefinitionsManager
 
 
+# Academic sources offered as checkboxes, in display order
+_SOURCES = ('stanford', 'iep', 'arxiv', 'scholar')
+
+# Separators in the terms box: newlines and commas
+_TERM_SPLIT = re.compile(r'[,\n]+')
+
+# Processing results are kept across sessions, most recent last
+_PROCESS_CACHE_PATH = Path.home() / ".cache" / "theophysics" / "footnote_cache.json"
+_PROCESS_CACHE_VERSION = 1
+# Entries kept in each of the tab's caches
+_CACHE_ENTRIES = 64
+
+
+@lru_cache(maxsize=4096)
+def _short(explanation: str) -> str:
+    """Explanation excerpt shown in a footnote's list row."""
+    return f" - {explanation[:50]}..." if explanation else ""
+
+
+# Fields a footnote's list row is built from
+_row_fields = operator.attrgetter('marker', 'term', 'explanation')
+
+
+def _footnote_label(footnote: Footnote) -> str:
+    """List row text for one footnote."""
+    marker, term, explanation = _row_fields(footnote)
+    return f"[{marker}] {term}{_short(explanation)}"
+
+
+def _paragraph_chunks(text: str, size: int) -> List[str]:
+    """Split text into pieces of `size` paragraphs that concatenate back to it."""
+    paragraphs = text.split('\n\n')
+    chunks = [
+        '\n\n'.join(paragraphs[i:i + size])
+        for i in range(0, len(paragraphs), size)
+    ]
+    return [chunk + '\n\n' for chunk in chunks[:-1]] + chunks[-1:]
+
+
+def _cache_put(cache: dict, key: str, value) -> None:
+    """Store value as the newest entry, dropping the oldest past _CACHE_ENTRIES."""
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > _CACHE_ENTRIES:
+        del cache[next(iter(cache))]
+
+
+class FootnoteListModel(QAbstractListModel):
+    """
+    List model reading straight from a FootnoteSystem's footnotes.
+    
+    The system changes its list on its own, so the model keeps the row
+    count it last announced and is told to catch up via rows_appended()
+    or reset().
+    """
+    
+    def __init__(self, footnote_system: FootnoteSystem, parent=None):
+        super().__init__(parent)
+        self._system = footnote_system
+        self._count = len(footnote_system.footnotes)
+    
+    def rows_appended(self) -> None:
+        """Show footnotes appended to the system since the last update."""
+        count = len(self._system.footnotes)
+        if count > self._count:
+            self.beginInsertRows(QModelIndex(), self._count, count - 1)
+            self._count = count
+            self.endInsertRows()
+    
+    def reset(self) -> None:
+        """Show the system's current footnotes from scratch."""
+        self.beginResetModel()
+        self._count = len(self._system.footnotes)
+        self.endResetModel()
+    
+    def footnote(self, index: QModelIndex) -> Optional[Footnote]:
+        """The footnote at a view index."""
+        if not index.isValid() or index.row() >= self._count:
+            return None
+        return self._system.footnotes[index.row()]
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._count
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return _footnote_label(self._system.footnotes[index.row()])
+        if role == Qt.UserRole:
+            # Index into the system's footnotes; footnote() returns the object
+            return index.row()
+        return None
+
+
+class _ProcessSignals(QObject):
+    """Signals for ProcessWorker (QRunnable is not a QObject)."""
+    # (system holding the new footnotes, processed text, footnotes
+    # section, term count) or None, error message ('' on success)
+    finished = Signal(object, str)
+
+
+class ProcessWorker(QRunnable):
+    """
+    Run FootnoteSystem.process_text off the GUI thread.
+    
+    Works on an empty copy of the tab's system, so the footnotes shown
+    stay untouched until the results are adopted on the GUI thread.
+    """
+    
+    def __init__(self, system: FootnoteSystem, text: str, terms: list, signals: _ProcessSignals):
+        super().__init__()
+        self.system = system
+        self.text = text
+        self.terms = terms
+        self.signals = signals
+    
+    def run(self):
+        try:
+            processed_text, footnotes_section = self.system.process_text(self.text, self.terms)
+        except Exception as e:
+            self.signals.finished.emit(None, str(e))
+            return
+        self.signals.finished.emit(
+            (self.system, processed_text, footnotes_section, len(self.terms)), ""
+        )
+
+
 class FootnoteTab(QWidget):
     """Tab for managing footnotes."""
     
+    PROCESS_DELAY_MS = 25
+    STATUS_TIMEOUT_MS = 2500
+    # Paragraphs added to the output pane per event-loop pass
+    OUTPUT_CHUNK_PARAGRAPHS = 32
+    
     def __init__(
         self,
         footnote_system: FootnoteSystem,
@@ -28,10 +178,46 @@ class FootnoteTab(QWidget):
         definitions_manager: ObsidianDefinitionsManager
     ):
         super().__init__()
+        self._clipboard = QApplication.clipboard()
+        # Dialogs are built on first use and then reused
+        self._warning_box: Optional[QMessageBox] = None
+        self._question_box: Optional[QMessageBox] = None
         self.footnote_system = footnote_system
         self.research_linker = research_linker
         self.definitions_manager = definitions_manager
-        self._setup_ui()
+        self._source_display = {source: research_linker.display_name(source) for source in _SOURCES}
+        # (processed text, footnotes section) waiting for _flush_output
+        self._pending_output = None
+        # Rest of a long output, appended a chunk per timer tick
+        self._output_chunks: Deque[str] = deque()
+        self._output_timer = QTimer(self)
+        self._output_timer.setSingleShot(True)
+        self._output_timer.timeout.connect(self._append_output_chunk)
+        self._process_signals = _ProcessSignals(self)
+        self._process_signals.finished.connect(self._on_processed)
+        # Process requests are coalesced: clicks within PROCESS_DELAY_MS,
+        # or made while a run is in flight, collapse into the latest one
+        self._process_request = None
+        self._process_running = None
+        self._process_timer = QTimer(self)
+        self._process_timer.setSingleShot(True)
+        self._process_timer.setInterval(self.PROCESS_DELAY_MS)
+        self._process_timer.timeout.connect(self._dispatch_process)
+        self._running_key = ""
+        # Content hash -> result, for unchanged input or footnotes
+        self._process_cache: Dict[str, list] = self._load_process_cache()
+        self._section_cache: Dict[str, str] = {}
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._save_process_cache)
+        
+        # Build the whole widget tree before the first paint
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.updateGeometry()
     
     def _setup_ui(self) -> None:
         """Setup the user interface."""
@@ -58,6 +244,15 @@ class FootnoteTab(QWidget):
         
         # Set splitter proportions
         splitter.setSizes([400, 600])
+        
+        # Transient confirmations, instead of modal dialogs
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #888;")
+        layout.addWidget(self.status_label)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(self.STATUS_TIMEOUT_MS)
+        self._status_timer.timeout.connect(self.status_label.clear)
     
     def _create_footnote_management_panel(self) -> QWidget:
         """Create the left panel for managing footnotes."""
@@ -87,9 +282,16 @@ class FootnoteTab(QWidget):
         sources_label = QLabel("Academic Sources (check to include):")
         add_layout.addWidget(sources_label)
         self.source_checkboxes = {}
+        # Non-exclusive group; toggles keep _checked_sources current, so
+        # reading the selection never goes back to the widgets
+        self._sources_group = QButtonGroup(self)
+        self._sources_group.setExclusive(False)
+        self._checked_sources = set()
+        self._sources_group.idToggled.connect(self._on_source_toggled)
         sources_layout = QVBoxLayout()
-        for source in ['stanford', 'iep', 'arxiv', 'scholar']:
-            cb = QCheckBox(self.research_linker.LINK_TEMPLATES.get(source, {}).get('display_name', source))
+        for i, source in enumerate(_SOURCES):
+            cb = QCheckBox(self._source_display[source])
+            self._sources_group.addButton(cb, i)
             cb.setChecked(source == 'stanford')  # Default to Stanford
             self.source_checkboxes[source] = cb
             sources_layout.addWidget(cb)
@@ -115,8 +317,14 @@ class FootnoteTab(QWidget):
         list_label = QLabel("Current Footnotes:")
         layout.addWidget(list_label)
         
-        self.footnotes_list = QListWidget()
-        self.footnotes_list.itemDoubleClicked.connect(self._edit_footnote)
+        self.footnotes_model = FootnoteListModel(self.footnote_system, self)
+        self.footnotes_list = QListView()
+        # Uniform rows laid out in batches keep long lists cheap to show
+        self.footnotes_list.setUniformItemSizes(True)
+        self.footnotes_list.setLayoutMode(QListView.Batched)
+        self.footnotes_list.setBatchSize(64)
+        self.footnotes_list.setModel(self.footnotes_model)
+        self.footnotes_list.doubleClicked.connect(self._edit_footnote)
         layout.addWidget(self.footnotes_list)
         
         # Buttons
@@ -144,7 +352,8 @@ class FootnoteTab(QWidget):
         input_group = QGroupBox("Input Text")
         input_layout = QVBoxLayout()
         
-        self.input_text = QTextEdit()
+        # Plain-text panes: their line-based layout stays fast on long documents
+        self.input_text = QPlainTextEdit()
         self.input_text.setPlaceholderText("Paste your text here...")
         input_layout.addWidget(self.input_text)
         
@@ -157,9 +366,9 @@ class FootnoteTab(QWidget):
         input_layout.addWidget(self.terms_input)
         
         # Process button
-        process_btn = QPushButton("📝 Process & Add Footnotes")
-        process_btn.clicked.connect(self._process_text)
-        input_layout.addWidget(process_btn)
+        self.process_btn = QPushButton("📝 Process & Add Footnotes")
+        self.process_btn.clicked.connect(self._process_text)
+        input_layout.addWidget(self.process_btn)
         
         input_group.setLayout(input_layout)
         layout.addWidget(input_group)
@@ -168,7 +377,7 @@ class FootnoteTab(QWidget):
         output_group = QGroupBox("Output (with footnotes)")
         output_layout = QVBoxLayout()
         
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
         output_layout.addWidget(self.output_text)
         
@@ -184,7 +393,7 @@ class FootnoteTab(QWidget):
         footnotes_group = QGroupBox("Footnotes Section")
         footnotes_layout = QVBoxLayout()
         
-        self.footnotes_preview = QTextEdit()
+        self.footnotes_preview = QPlainTextEdit()
         self.footnotes_preview.setReadOnly(True)
         footnotes_layout.addWidget(self.footnotes_preview)
         
@@ -205,12 +414,11 @@ class FootnoteTab(QWidget):
         
         # Get selected academic sources
         academic_sources = [
-            source for source, cb in self.source_checkboxes.items()
-            if cb.isChecked()
+            source for source in _SOURCES if source in self._checked_sources
         ] or None  # None means auto-select
         
         if not term:
-            QMessageBox.warning(self, "Missing Term", "Please enter a term.")
+            self._warn("Missing Term", "Please enter a term.")
             return
         
         marker = self.footnote_system.add_footnote(
@@ -220,10 +428,11 @@ class FootnoteTab(QWidget):
             explanation=explanation
         )
         
-        self._refresh_footnotes_list()
+        # Only a new footnote needs a row; a known term returns its marker
+        self.footnotes_model.rows_appended()
         self._clear_footnote_form()
         
-        QMessageBox.information(self, "Added", f"Footnote [{marker}] added for '{term}'.")
+        self._flash_status(f"Footnote [{marker}] added for '{term}'.")
     
     def _process_text(self) -> None:
         """Process input text and add footnotes."""
@@ -231,87 +440,260 @@ class FootnoteTab(QWidget):
         terms_str = self.terms_input.toPlainText().strip()
         
         if not text:
-            QMessageBox.warning(self, "No Text", "Please enter text to process.")
+            self._warn("No Text", "Please enter text to process.")
             return
         
         if not terms_str:
-            QMessageBox.warning(self, "No Terms", "Please specify terms to footnote.")
+            self._warn("No Terms", "Please specify terms to footnote.")
             return
         
-        # Parse terms (support both newline and comma-separated)
-        terms = []
-        for line in terms_str.split('\n'):
-            terms.extend([t.strip() for t in line.split(',') if t.strip()])
+        # Parse terms (support both newline and comma-separated), dropping repeats
+        terms = list(dict.fromkeys(t for t in map(str.strip, _TERM_SPLIT.split(terms_str)) if t))
         
-        # Clear existing footnotes
-        self.footnote_system.clear()
-        
-        # Process text
-        processed_text, footnotes_section = self.footnote_system.process_text(text, terms)
+        self._process_request = (text, tuple(terms))
+        self._process_timer.start()
+    
+    def _dispatch_process(self) -> None:
+        """Start the latest process request on the pool, one run at a time."""
+        if self._process_running is not None or self._process_request is None:
+            return  # _on_processed dispatches what is left
+        request = self._process_request
+        self._process_request = None
+        self._process_running = request
+        
+        # The results replace the existing footnotes
+        text, terms = request
+        self._running_key = self._process_key(text, terms)
+        cached = self._process_cache.get(self._running_key)
+        if cached is not None:
+            try:
+                processed_text, footnotes_section, footnotes, term_count = cached
+                system = self.footnote_system.empty_copy()
+                for data in footnotes:
+                    footnote = Footnote(**data)
+                    system.footnotes.append(footnote)
+                    system.term_to_footnote[footnote.term.lower()] = footnote.marker
+            except (AttributeError, TypeError, ValueError) as e:
+                # A bad entry is forgotten and the text processed afresh
+                print(f"Ignoring footnote cache entry: {e}")
+                self._process_cache.pop(self._running_key, None)
+            else:
+                self._on_processed((system, processed_text, footnotes_section, term_count), "")
+                return
+        
+        QThreadPool.globalInstance().start(ProcessWorker(
+            self.footnote_system.empty_copy(), text, list(terms), self._process_signals
+        ))
+    
+    def _on_processed(self, result, error: str) -> None:
+        """Adopt finished processing results and show them."""
+        finished_request = self._process_running
+        self._process_running = None
+        if self._process_request is not None:
+            if self._process_request == finished_request:
+                # Re-clicked with unchanged input; these results answer it
+                self._process_request = None
+            else:
+                self._process_timer.start()
+        
+        if error:
+            self._warn("Error", f"Failed to process text: {error}")
+            return
         
-        # Update outputs
-        self.output_text.setText(processed_text)
-        self.footnotes_preview.setText(footnotes_section)
+        system, processed_text, footnotes_section, term_count = result
+        self.footnote_system.adopt(system)
+        # The model reads the system's list, so it must follow right away
         self._refresh_footnotes_list()
-        
-        QMessageBox.information(
-            self,
-            "Processed",
-            f"Processed {len(terms)} terms. Added {len(self.footnote_system.footnotes)} footnotes."
+        _cache_put(self._process_cache, self._running_key, [
+            processed_text, footnotes_section,
+            [asdict(f) for f in system.footnotes], term_count
+        ])
+        
+        # Update outputs on the next event-loop pass, coalescing repeats
+        if self._pending_output is None:
+            QTimer.singleShot(0, self._flush_output)
+        self._pending_output = (processed_text, footnotes_section)
+        
+        self._flash_status(
+            f"Processed {term_count} terms. Added {len(self.footnote_system.footnotes)} footnotes."
         )
     
+    def _flush_output(self) -> None:
+        """Show the latest processing results, laying each pane out once."""
+        if self._pending_output is None:
+            return
+        processed_text, footnotes_section = self._pending_output
+        self._pending_output = None
+        
+        # Long output is laid out a chunk at a time so the event loop keeps
+        # running; a newer result replaces whatever is still queued
+        chunks = _paragraph_chunks(processed_text, self.OUTPUT_CHUNK_PARAGRAPHS)
+        self._output_chunks = deque(chunks[1:])
+        if self._output_chunks:
+            self._output_timer.start()
+        
+        for widget, text in (
+            (self.output_text, chunks[0]),
+            (self.footnotes_preview, footnotes_section),
+        ):
+            widget.setUpdatesEnabled(False)
+            blocker = QSignalBlocker(widget)
+            try:
+                widget.setPlainText(text)
+            finally:
+                blocker.unblock()
+                widget.setUpdatesEnabled(True)
+    
+    def _append_output_chunk(self) -> None:
+        """Append the next queued piece of output text."""
+        if not self._output_chunks:
+            return
+        chunk = self._output_chunks.popleft()
+        self.output_text.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.output_text)
+        try:
+            cursor = QTextCursor(self.output_text.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(chunk)
+        finally:
+            blocker.unblock()
+            self.output_text.setUpdatesEnabled(True)
+        if self._output_chunks:
+            self._output_timer.start()
+    
+    def _finish_output(self) -> None:
+        """Append all output still queued, e.g. before copying it."""
+        self._output_timer.stop()
+        while self._output_chunks:
+            self._append_output_chunk()
+        self._output_timer.stop()
+    
     def _copy_output(self) -> None:
         """Copy output text to clipboard."""
-        from PySide6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        
-        # Combine text and footnotes
-        text = self.output_text.toPlainText()
-        footnotes = self.footnotes_preview.toPlainText()
-        full_content = f"{text}\n\n---\n\n{footnotes}"
-        
-        clipboard.setText(full_content)
-        QMessageBox.information(self, "Copied", "Output copied to clipboard.")
+        self._finish_output()
+        # Combine text and footnotes in a single join, without keeping the
+        # pane texts alive alongside the combined copy
+        self._clipboard.setText("\n\n---\n\n".join((
+            self.output_text.toPlainText(),
+            self.footnotes_preview.toPlainText(),
+        )))
+        self._flash_status("Output copied to clipboard.")
     
     def _copy_footnotes(self) -> None:
         """Copy footnotes section to clipboard."""
-        from PySide6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.footnotes_preview.toPlainText())
-        QMessageBox.information(self, "Copied", "Footnotes section copied to clipboard.")
+        self._clipboard.setText(self.footnotes_preview.toPlainText())
+        self._flash_status("Footnotes section copied to clipboard.")
+    
+    def _warn(self, title: str, text: str) -> None:
+        """Show a warning in the tab's reusable message box."""
+        if self._warning_box is None:
+            self._warning_box = QMessageBox(self)
+            self._warning_box.setIcon(QMessageBox.Warning)
+            self._warning_box.setStandardButtons(QMessageBox.Ok)
+        self._warning_box.setWindowTitle(title)
+        self._warning_box.setText(text)
+        self._warning_box.exec()
+    
+    def _ask(self, title: str, text: str) -> bool:
+        """Ask a yes/no question in the tab's reusable message box."""
+        if self._question_box is None:
+            self._question_box = QMessageBox(self)
+            self._question_box.setIcon(QMessageBox.Question)
+            self._question_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        self._question_box.setWindowTitle(title)
+        self._question_box.setText(text)
+        return self._question_box.exec() == QMessageBox.Yes
+    
+    def _flash_status(self, message: str) -> None:
+        """Show a confirmation below the panels for a few seconds."""
+        self.status_label.setText(message)
+        self._status_timer.start()
     
     def _clear_footnotes(self) -> None:
         """Clear all footnotes."""
-        reply = QMessageBox.question(
-            self,
-            "Clear All",
-            "Clear all footnotes?",
-            QMessageBox.Yes | QMessageBox.No
-        )
-        if reply == QMessageBox.Yes:
+        if self._ask("Clear All", "Clear all footnotes?"):
             self.footnote_system.clear()
             self._refresh_footnotes_list()
             self.footnotes_preview.clear()
     
     def _preview_footnotes(self) -> None:
         """Preview the footnotes section."""
-        section = self.footnote_system.generate_footnotes_section()
-        self.footnotes_preview.setText(section)
+        key = hashlib.sha256(repr([
+            (f.marker, f.term, f.vault_link, sorted(f.academic_links.items()), f.explanation)
+            for f in self.footnote_system.footnotes
+        ]).encode('utf-8')).hexdigest()
+        section = self._section_cache.get(key)
+        if section is None:
+            section = self.footnote_system.generate_footnotes_section()
+            _cache_put(self._section_cache, key, section)
+        self.footnotes_preview.setPlainText(section)
+    
+    def _process_key(self, text: str, terms) -> str:
+        """Cache key for processing text with terms under the current link setup."""
+        linker = self.research_linker
+        links = json.dumps([linker.link_priority, linker.custom_links], sort_keys=True)
+        digest = hashlib.sha256()
+        for part in (text, '\n'.join(terms), links):
+            digest.update(part.encode('utf-8', 'surrogatepass'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _load_process_cache() -> Dict[str, list]:
+        """Load the processing results saved by an earlier session."""
+        try:
+            with open(_PROCESS_CACHE_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != _PROCESS_CACHE_VERSION:
+            return {}
+        entries = data.get('entries')
+        if not isinstance(entries, dict):
+            return {}
+        # Drop malformed entries so a damaged cache costs a rerun, not the tab
+        return {
+            key: entry for key, entry in entries.items()
+            if FootnoteTab._valid_process_entry(entry)
+        }
+    
+    @staticmethod
+    def _valid_process_entry(entry) -> bool:
+        """Whether entry has the shape _on_processed stores."""
+        if not (isinstance(entry, list) and len(entry) == 4):
+            return False
+        processed_text, footnotes_section, footnotes, term_count = entry
+        if not (isinstance(processed_text, str) and isinstance(footnotes_section, str)
+                and isinstance(footnotes, list) and isinstance(term_count, int)):
+            return False
+        field_names = {f.name for f in fields(Footnote)}
+        return all(
+            isinstance(data, dict) and data.keys() <= field_names
+            and isinstance(data.get('marker'), int) and isinstance(data.get('term'), str)
+            and isinstance(data.get('vault_link'), (str, type(None)))
+            and isinstance(data.get('academic_links'), (dict, type(None)))
+            and isinstance(data.get('explanation', ''), str)
+            for data in footnotes
+        )
+    
+    def _save_process_cache(self) -> None:
+        """Persist processing results for the next session."""
+        tmp_path = _PROCESS_CACHE_PATH.with_name(_PROCESS_CACHE_PATH.name + '.tmp')
+        try:
+            _PROCESS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': _PROCESS_CACHE_VERSION, 'entries': self._process_cache}, f)
+            os.replace(tmp_path, _PROCESS_CACHE_PATH)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error saving footnote cache: {e}")
     
     def _refresh_footnotes_list(self) -> None:
-        """Refresh the footnotes list."""
-        self.footnotes_list.clear()
-        for footnote in self.footnote_system.footnotes:
-            item_text = f"[{footnote.marker}] {footnote.term}"
-            if footnote.explanation:
-                item_text += f" - {footnote.explanation[:50]}..."
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, footnote)
-            self.footnotes_list.addItem(item)
-    
-    def _edit_footnote(self, item: QListWidgetItem) -> None:
+        """Show the system's footnotes after its list was replaced."""
+        self.footnotes_model.reset()
+    
+    def _edit_footnote(self, index: QModelIndex) -> None:
         """Edit a footnote (double-click)."""
-        footnote = item.data(Qt.UserRole)
+        footnote = self.footnotes_model.footnote(index)
         if footnote:
             self.term_input.setText(footnote.term)
             self.vault_link_input.setText(footnote.vault_link or "")
@@ -320,6 +702,13 @@ class FootnoteTab(QWidget):
             for source, cb in self.source_checkboxes.items():
                 cb.setChecked(source in footnote.academic_links)
     
+    def _on_source_toggled(self, button_id: int, checked: bool) -> None:
+        """Track which academic source checkboxes are checked."""
+        if checked:
+            self._checked_sources.add(_SOURCES[button_id])
+        else:
+            self._checked_sources.discard(_SOURCES[button_id])
+    
     def _clear_footnote_form(self) -> None:
         """Clear the footnote form."""
         self.term_input.clear()
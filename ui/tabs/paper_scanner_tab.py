@@ -5,37 +5,195 @@ Uses NLP (spaCy) for intelligent term detection and can link to SEP/Wikipedia.
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import json
+import multiprocessing
+import operator
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from collections import Counter
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox,
+    QTableView, QHeaderView, QGroupBox, QStyledItemDelegate, QStyle,
+    QStyleOptionButton, QApplication,
     QMessageBox, QSplitter, QListWidget, QListWidgetItem,
     QCheckBox, QProgressBar, QTextEdit, QComboBox
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QThread, Signal, QAbstractTableModel, QModelIndex, QEvent
 
-from typing import TYPE_CHECKING, List, Dict, Set
+from typing import TYPE_CHECKING, Callable, FrozenSet, Iterator, List, Dict, Optional, Sequence, Tuple
 
 if TYPE_CHECKING:
     from core.obsidian_definitions_manager import ObsidianDefinitionsManager
 
 # Try to import NLP detector
 try:
-    from core.nlp_term_detector import NLPTermDetector, DetectedTerm
+    from core.nlp_term_detector import NLPTermDetector, DetectedTerm, detect_terms_in_files, iter_terms_in_files
     NLP_AVAILABLE = True
 except ImportError:
     NLP_AVAILABLE = False
     print("⚠️ NLP Term Detector not available")
 
 
+def _definition_matcher(defs_lower: FrozenSet[str]) -> Callable[[str], bool]:
+    """
+    Build a test for whether a lowercased term is already defined.
+    
+    A term counts as defined if it equals one of the (lowercase)
+    definitions, appears inside one, or contains one. The definitions are
+    indexed so each test avoids a full pass over them.
+    """
+    # Newline-joined, so a newline-free term matches inside one definition only
+    defs_blob = "\n".join(sorted(defs_lower))
+    # Definitions keyed by their first two characters, for the "contains" check
+    buckets: Dict[str, List[str]] = {}
+    short_defs = []
+    for d in defs_lower:
+        if len(d) < 2:
+            short_defs.append(d)
+        else:
+            buckets.setdefault(d[:2], []).append(d)
+    
+    def is_defined(term_lower: str) -> bool:
+        if not defs_lower:
+            return False
+        if term_lower in defs_lower:
+            return True
+        if "\n" in term_lower:
+            if any(term_lower in d for d in defs_lower):
+                return True
+        elif term_lower in defs_blob:
+            return True
+        if any(d in term_lower for d in short_defs):
+            return True
+        for i in range(len(term_lower) - 1):
+            bucket = buckets.get(term_lower[i:i + 2])
+            if bucket and any(term_lower.startswith(d, i) for d in bucket):
+                return True
+        return False
+    
+    return is_defined
+
+
+_match_text = operator.methodcaller('group')
+_count_of = operator.itemgetter(1)
+
+# Per-file scan results, reused while a file's mtime and size are unchanged
+_SCAN_CACHE_PATH = Path.home() / ".cache" / "theophysics" / "paper_scan_cache.json"
+_SCAN_CACHE_VERSION = 1
+
+# Directories never scanned for papers, besides hidden ones (.obsidian, .git, ...)
+_SKIP_DIRS = frozenset({'node_modules', '__pycache__'})
+
+
+def _iter_md(root: Path) -> Iterator[Path]:
+    """Yield the markdown files under root, skipping hidden and tool directories."""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.') and entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.md'):
+                        yield Path(entry.path)
+        except OSError as e:
+            print(f"Error listing folder: {e}")
+
+
+# Skeleton written by "Create All Definitions" for each undefined term
+_NEW_DEFINITION_TEMPLATE = '''---
+aliases: []
+title: {term}
+type: definition
+status: draft
+created: {date}
+papers: [{papers}]
+---
+
+# {term}
+
+## 1. Aliases
+<!-- Other names, symbols -->
+
+## 2. Core Definition
+<!-- ONE SENTENCE. What this IS. -->
+
+## 3. Operational Definition
+<!-- How it FUNCTIONS in Theophysics -->
+
+## 4. Ontological Context
+<!-- Triad/Domain/Layer -->
+
+## 5. Relationships
+| Relation | Term |
+|----------|------|
+| Parent | |
+| Children | |
+| See Also | |
+
+## 6. Scientific Definition
+<!-- Standard physics definition -->
+
+## 7. Narrative Definition
+<!-- Simple explanation -->
+
+---
+## Metadata
+**Found in papers:** {papers}
+**Occurrences:** {count}
+**Tags:** #glossary #theophysics #needs-definition
+'''
+
+
+def _create_file(path: Path, data: bytes) -> Optional[bool]:
+    """
+    Create path with data in one write. False if it already exists, None
+    if it could not be written.
+    """
+    try:
+        with open(path, 'xb') as f:
+            f.write(data)
+        return True
+    except FileExistsError:
+        return False
+    except OSError as e:
+        print(f"Error creating {path}: {e}")
+        return None
+
+
 class ScannerThread(QThread):
     """Background thread for scanning papers using NLP."""
     progress = Signal(int, str)  # progress %, message
     finished = Signal(dict)  # results
     
-    def __init__(self, papers_folder: Path, papers_to_scan: List[str], existing_definitions: Set[str], use_nlp: bool = True):
+    # NLP scans of at least PARALLEL_MIN_FILES files are spread over worker
+    # processes in batches of BATCH_FILES. Each worker loads its own spaCy
+    # model, so the pool stays small.
+    BATCH_FILES = 16
+    PARALLEL_MIN_FILES = 64
+    MAX_PROCESSES = 4
+    PROGRESS_INTERVAL = 0.1  # seconds between progress updates within the same percent
+    
+    # Regex fallback. A capitalized phrase also counts each of its words, so
+    # the two patterns run separately rather than as one alternation. Greek
+    # symbols are not matched: single characters never passed the old length
+    # filter, so that pass found nothing.
+    _PHRASE_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b')
+    _WORD_RE = re.compile(r'\b[A-Z][a-z]{3,}\b')
+    _REGEX_EXCLUDE = frozenset({
+        'The', 'This', 'That', 'These', 'Those', 'What', 'When', 'Where',
+        'Which', 'While', 'With', 'Would', 'Will', 'Was', 'Were', 'Are',
+        'Section', 'Chapter', 'Paper', 'Figure', 'Table', 'Equation',
+        'However', 'Therefore', 'Thus', 'Physical', 'Theological',
+    })
+    
+    def __init__(self, papers_folder: Path, papers_to_scan: List[str], existing_definitions: FrozenSet[str], use_nlp: bool = True):
         super().__init__()
         self.papers_folder = papers_folder
         self.papers_to_scan = papers_to_scan
@@ -50,9 +208,25 @@ class ScannerThread(QThread):
             'terms_with_links': [],  # NEW: terms that have SEP/Wikipedia links
             'by_paper': {},
             'total_files': 0,
-            'detected_terms': []  # Full DetectedTerm objects
+            'detected_terms': [],  # Full DetectedTerm objects
+            'all_terms': [],
+            'undefined_idx': [],
+            'defined_idx': [],
+            'linked_idx': []
         }
         
+        # finished is always emitted so the tab re-enables scanning
+        try:
+            self._scan(results)
+            self.progress.emit(100, "Scan complete!")
+        except Exception as e:
+            print(f"Scan error: {e}")
+            self.progress.emit(100, f"⚠️ Scan failed: {e}")
+        finally:
+            self.finished.emit(results)
+    
+    def _scan(self, results: dict) -> None:
+        """Scan the papers, filling in results."""
         # Initialize NLP detector if available
         detector = None
         if self.use_nlp:
@@ -67,111 +241,76 @@ class ScannerThread(QThread):
         
         # Handle recursive mode vs specific subfolder mode
         is_recursive = self.papers_to_scan == ["__RECURSIVE__"]
-        
         if is_recursive:
-            # Scan all .md files in the entire folder recursively
             self.progress.emit(10, f"Scanning all files in {self.papers_folder.name}...")
-            all_md_files = list(self.papers_folder.rglob("*.md"))
-            total_files = len(all_md_files)
-            
-            for idx, md_file in enumerate(all_md_files):
-                progress_pct = int(10 + (idx / max(total_files, 1)) * 70)
-                self.progress.emit(progress_pct, f"Scanning {md_file.name}...")
-                results['total_files'] += 1
-                
-                # Determine which "paper/folder" this belongs to
-                try:
-                    rel_path = md_file.relative_to(self.papers_folder)
-                    paper_name = rel_path.parts[0] if len(rel_path.parts) > 1 else "root"
-                except:
-                    paper_name = "root"
-                
-                if paper_name not in results['by_paper']:
-                    results['by_paper'][paper_name] = Counter()
-                
-                try:
-                    content = md_file.read_text(encoding='utf-8')
-                    
-                    if detector:
-                        terms = detector.detect_terms(content, str(md_file))
-                        for term in terms:
-                            key = term.text.lower()
-                            results['by_paper'][paper_name][term.text] += term.count
-                            results['proper_nouns'][term.text] += term.count
-                            
-                            if key not in all_detected:
-                                all_detected[key] = term
-                            else:
-                                all_detected[key].count += term.count
-                                if str(md_file) not in all_detected[key].sources:
-                                    all_detected[key].sources.append(str(md_file))
-                    else:
-                        terms = self._regex_detect(content)
-                        for term, count in terms.items():
-                            results['by_paper'][paper_name][term] += count
-                            results['proper_nouns'][term] += count
-                except Exception as e:
-                    print(f"Error reading {md_file}: {e}")
-            
-            # Convert by_paper counters to dicts with top 50
-            for paper_name in results['by_paper']:
-                results['by_paper'][paper_name] = dict(
-                    Counter(results['by_paper'][paper_name]).most_common(50)
-                )
         else:
-            # Original mode: scan specific subfolders
-            total_papers = len(self.papers_to_scan)
+            self.progress.emit(10, f"Scanning {len(self.papers_to_scan)} folders...")
+        paper_files = self._collect_files(is_recursive)
+        for paper_name, _ in paper_files:
+            if paper_name not in results['by_paper']:
+                results['by_paper'][paper_name] = Counter()
+        if not is_recursive:
+            # Selected folders without markdown files still get an entry
+            for paper_name in self.papers_to_scan:
+                if (self.papers_folder / paper_name).exists():
+                    results['by_paper'].setdefault(paper_name, Counter())
+        
+        # Unchanged files come from the scan cache; the rest are scanned in
+        # parallel. Results are merged here in file order.
+        total_files = len(paper_files)
+        paths = [str(md_file) for _, md_file in paper_files]
+        scan_cache = self._load_scan_cache()
+        cache_entries = scan_cache.setdefault(self._cache_mode(detector), {})
+        if is_recursive:
+            roots = [self.papers_folder]
+        else:
+            roots = [self.papers_folder / paper_name for paper_name in self.papers_to_scan]
+        self._prune_cache(cache_entries, roots, paths)
+        
+        last_pct, last_emit = -1, 0.0
+        for idx, ((paper_name, _), (md_str, found)) in enumerate(
+            zip(paper_files, self._scan_files_cached(paths, detector, cache_entries))
+        ):
+            # Throttled, so large scans don't flood the GUI thread with signals
+            progress_pct = int(10 + (idx / max(total_files, 1)) * 70)
+            now = time.monotonic()
+            if progress_pct != last_pct or now - last_emit >= self.PROGRESS_INTERVAL:
+                self.progress.emit(progress_pct, f"Scanning file {idx + 1}/{total_files}...")
+                last_pct, last_emit = progress_pct, now
+            results['total_files'] += 1
+            if found is None:
+                continue
             
-            for idx, paper_name in enumerate(self.papers_to_scan):
-                progress_pct = int(10 + (idx / total_papers) * 70)
-                self.progress.emit(progress_pct, f"Scanning {paper_name}...")
-                
-                paper_folder = self.papers_folder / paper_name
-                if not paper_folder.exists():
-                    continue
-                    
-                paper_terms = Counter()
-                
-                # Scan all .md files in the paper folder
-                for md_file in paper_folder.rglob("*.md"):
-                    results['total_files'] += 1
-                    
-                    try:
-                        content = md_file.read_text(encoding='utf-8')
-                        
-                        if detector:
-                            # Use NLP-based detection
-                            terms = detector.detect_terms(content, str(md_file))
-                            for term in terms:
-                                key = term.text.lower()
-                                paper_terms[term.text] += term.count
-                                results['proper_nouns'][term.text] += term.count
-                                
-                                if key not in all_detected:
-                                    all_detected[key] = term
-                                else:
-                                    all_detected[key].count += term.count
-                                    if str(md_file) not in all_detected[key].sources:
-                                        all_detected[key].sources.append(str(md_file))
-                        else:
-                            # Fallback to regex-based detection
-                            terms = self._regex_detect(content)
-                            for term, count in terms.items():
-                                paper_terms[term] += count
-                                results['proper_nouns'][term] += count
-                                    
-                    except Exception as e:
-                        print(f"Error reading {md_file}: {e}")
-                
-                results['by_paper'][paper_name] = dict(paper_terms.most_common(50))
+            paper_terms = results['by_paper'][paper_name]
+            if detector:
+                paper_terms.update({term.text: term.count for term in found})
+                for term in found:
+                    existing = all_detected.setdefault(term.text.lower(), term)
+                    if existing is not term:
+                        existing.count += term.count
+                        existing.add_source(md_str)
+            else:
+                paper_terms.update(found)
+        
+        self._save_scan_cache(scan_cache)
+        
+        # Corpus totals: each file counted into exactly one paper, so merge
+        # the per-paper counters once instead of every file twice
+        for paper_terms in results['by_paper'].values():
+            results['proper_nouns'].update(paper_terms)
+        
+        # Convert by_paper counters to dicts with top 50
+        for paper_name, paper_terms in results['by_paper'].items():
+            results['by_paper'][paper_name] = dict(
+                heapq.nlargest(50, paper_terms.items(), key=_count_of)
+            )
         
         # Resolve links for terms (SEP/Wikipedia)
         if detector and all_detected:
             self.progress.emit(85, "Resolving links (SEP/Wikipedia)...")
             try:
-                terms_list = list(all_detected.values())
                 # Only resolve for top 50 terms to avoid rate limiting
-                top_terms = sorted(terms_list, key=lambda t: t.count, reverse=True)[:50]
+                top_terms = heapq.nlargest(50, all_detected.values(), key=operator.attrgetter('count'))
                 detector.resolve_links(top_terms, use_sep=True, use_wikipedia=True)
             except Exception as e:
                 print(f"Link resolution error: {e}")
@@ -180,56 +319,338 @@ class ScannerThread(QThread):
         
         # Categorize as defined or undefined
         self.progress.emit(95, "Categorizing terms...")
+        is_defined = _definition_matcher(self.existing_definitions)
         
         for term_obj in all_detected.values():
-            term = term_obj.text
-            count = term_obj.count
-            term_lower = term.lower()
-            
-            is_defined = any(
-                term_lower == d.lower() or term_lower in d.lower() or d.lower() in term_lower
-                for d in self.existing_definitions
-            )
-            
-            if is_defined:
-                results['defined_terms'].append((term, count, term_obj.link, term_obj.label))
-            else:
-                results['undefined_terms'].append((term, count, term_obj.link, term_obj.label))
-            
             if term_obj.link:
-                results['terms_with_links'].append((term, term_obj.link, term_obj.link_source))
-        
-        # Sort by count
-        results['undefined_terms'].sort(key=lambda x: -x[1])
-        results['defined_terms'].sort(key=lambda x: -x[1])
+                results['terms_with_links'].append((term_obj.text, term_obj.link, term_obj.link_source))
         
-        self.progress.emit(100, "Scan complete!")
-        self.finished.emit(results)
+        # One list sorted by count; each filter view is a list of indices into it
+        all_terms = [
+            (t.text, t.count, t.link, t.label)
+            for t in sorted(all_detected.values(), key=lambda t: -t.count)
+        ]
+        undefined_idx, defined_idx, linked_idx = [], [], []
+        for i, (term, _, link, _) in enumerate(all_terms):
+            (defined_idx if is_defined(term.lower()) else undefined_idx).append(i)
+            if link:
+                linked_idx.append(i)
+        results['all_terms'] = all_terms
+        results['undefined_idx'] = undefined_idx
+        results['defined_idx'] = defined_idx
+        results['linked_idx'] = linked_idx
+        results['undefined_terms'] = [all_terms[i] for i in undefined_idx]
+        results['defined_terms'] = [all_terms[i] for i in defined_idx]
     
-    def _regex_detect(self, content: str) -> Dict[str, int]:
-        """Fallback regex-based detection."""
-        terms = Counter()
-        
-        patterns = [
-            r'[ΨΦΛΩχψφλωΓγΔδΣσΠπΘθ]',
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b',
-            r'\b[A-Z][a-z]{3,}\b',
+    def _collect_files(self, is_recursive: bool) -> List[Tuple[str, Path]]:
+        """List the markdown files to scan with the paper/folder each belongs to."""
+        if is_recursive:
+            paper_files = []
+            for md_file in _iter_md(self.papers_folder):
+                # Determine which "paper/folder" this belongs to
+                try:
+                    rel_path = md_file.relative_to(self.papers_folder)
+                    paper_name = rel_path.parts[0] if len(rel_path.parts) > 1 else "root"
+                except ValueError:
+                    paper_name = "root"
+                paper_files.append((paper_name, md_file))
+            return paper_files
+        
+        paper_files = []
+        for paper_name in self.papers_to_scan:
+            paper_folder = self.papers_folder / paper_name
+            if paper_folder.exists():
+                paper_files.extend((paper_name, md_file) for md_file in _iter_md(paper_folder))
+        return paper_files
+    
+    @staticmethod
+    def _cache_mode(detector) -> str:
+        """Cache section for the current detection method; results differ between them."""
+        if not detector:
+            return "regex"
+        meta = getattr(detector.nlp, 'meta', None)
+        if not meta:
+            return "nlp"
+        return f"nlp:{meta.get('name')}-{meta.get('version')}"
+    
+    @staticmethod
+    def _prune_cache(entries: Dict[str, dict], roots: List[Path], paths: List[str]) -> None:
+        """Drop entries for files under the scanned roots that no longer exist."""
+        prefixes = tuple(str(root) + os.sep for root in roots)
+        current = set(paths)
+        for key in [k for k in entries if k.startswith(prefixes) and k not in current]:
+            del entries[key]
+    
+    def _scan_files_cached(
+        self, paths: List[str], detector, entries: Dict[str, dict]
+    ) -> Iterator[Tuple[str, object]]:
+        """
+        Like _scan_files, but reuse results for files whose mtime and size
+        match the cache entry, and store fresh results in entries.
+        """
+        stamps = []
+        misses = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                stamp = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                stamp = None
+            stamps.append(stamp)
+            entry = entries.get(path)
+            if stamp is None or entry is None or entry['stamp'] != stamp:
+                misses.append(path)
+        
+        scanned = self._scan_files(misses, detector)
+        for path, stamp in zip(paths, stamps):
+            entry = entries.get(path)
+            if stamp is not None and entry is not None and entry['stamp'] == stamp:
+                yield path, self._decode_cached(path, entry['found'], detector)
+                continue
+            path, found = next(scanned)
+            if found is None:
+                entries.pop(path, None)
+            elif stamp is not None:
+                entries[path] = {'stamp': stamp, 'found': self._encode_cached(found, detector)}
+            yield path, found
+    
+    @staticmethod
+    def _encode_cached(found, detector):
+        """JSON form of one file's scan result."""
+        if not detector:
+            return dict(found)
+        return [[t.text, t.label, t.count, t.link, t.link_source] for t in found]
+    
+    @staticmethod
+    def _decode_cached(path: str, data, detector):
+        """Rebuild one file's scan result from its JSON form."""
+        if not detector:
+            return Counter(data)
+        return [
+            DetectedTerm(text=text, label=label, count=count, sources=[path],
+                         link=link, link_source=link_source)
+            for text, label, count, link, link_source in data
         ]
-        
-        exclude_words = {
-            'The', 'This', 'That', 'These', 'Those', 'What', 'When', 'Where',
-            'Which', 'While', 'With', 'Would', 'Will', 'Was', 'Were', 'Are',
-            'Section', 'Chapter', 'Paper', 'Figure', 'Table', 'Equation',
-            'However', 'Therefore', 'Thus', 'Physical', 'Theological',
+    
+    @staticmethod
+    def _load_scan_cache() -> Dict[str, Dict[str, dict]]:
+        """Load per-file results saved by earlier scans."""
+        try:
+            with open(_SCAN_CACHE_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != _SCAN_CACHE_VERSION:
+            return {}
+        modes = data.get('modes')
+        if not isinstance(modes, dict):
+            return {}
+        # Drop malformed entries so a damaged cache costs a rescan, not the scan
+        return {
+            mode: {
+                path: entry for path, entry in entries.items()
+                if ScannerThread._valid_cache_entry(mode, entry)
+            }
+            for mode, entries in modes.items() if isinstance(entries, dict)
         }
+    
+    @staticmethod
+    def _valid_cache_entry(mode: str, entry) -> bool:
+        """Whether entry has the shape _encode_cached and the stamp check expect."""
+        if not isinstance(entry, dict):
+            return False
+        stamp = entry.get('stamp')
+        if not (isinstance(stamp, list) and len(stamp) == 2
+                and all(isinstance(v, int) for v in stamp)):
+            return False
+        found = entry.get('found')
+        if mode == "regex":
+            return isinstance(found, dict) and all(
+                isinstance(k, str) and isinstance(v, int) for k, v in found.items()
+            )
+        return isinstance(found, list) and all(
+            isinstance(t, list) and len(t) == 5
+            and isinstance(t[0], str) and isinstance(t[2], int)
+            for t in found
+        )
+    
+    @staticmethod
+    def _save_scan_cache(modes: Dict[str, Dict[str, dict]]) -> None:
+        """Persist per-file results for the next scan."""
+        tmp_path = _SCAN_CACHE_PATH.with_name(_SCAN_CACHE_PATH.name + '.tmp')
+        try:
+            _SCAN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': _SCAN_CACHE_VERSION, 'modes': modes}, f)
+            os.replace(tmp_path, _SCAN_CACHE_PATH)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error saving scan cache: {e}")
+    
+    def _scan_files(self, paths: List[str], detector) -> Iterator[Tuple[str, object]]:
+        """
+        Yield (path, result) for every file, in order.
+        
+        With a detector the result is the file's DetectedTerms, otherwise a
+        Counter of regex matches; None if the file could not be scanned.
+        """
+        if not detector:
+            # Regex scans are mostly file I/O, which threads overlap
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as executor:
+                yield from executor.map(self._regex_scan_file, paths)
+            return
         
-        for pattern in patterns:
-            for match in re.findall(pattern, content):
-                term = match.strip() if isinstance(match, str) else match
-                if term and len(term) > 2 and term not in exclude_words:
-                    terms[term] += 1
-        
-        return dict(terms)
+        batches = [paths[i:i + self.BATCH_FILES] for i in range(0, len(paths), self.BATCH_FILES)]
+        done = 0
+        if len(paths) >= self.PARALLEL_MIN_FILES:
+            workers = max(1, min(self.MAX_PROCESSES, (os.cpu_count() or 2) - 1))
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    for batch_results in executor.map(detect_terms_in_files, batches):
+                        done += 1
+                        yield from batch_results
+            except Exception as e:
+                # e.g. a worker died; finish the remaining batches here
+                print(f"Parallel scan error, continuing in this thread: {e}")
+        # One stream, so spaCy batches across file boundaries
+        yield from iter_terms_in_files(paths[done * self.BATCH_FILES:], detector)
+    
+    def _regex_scan_file(self, path: str) -> Tuple[str, Optional[Counter]]:
+        """Read one file and count its regex-detected terms."""
+        try:
+            # Same read as core.nlp_term_detector.read_markdown(), which may not be importable here
+            content = Path(path).read_bytes().decode('utf-8', 'replace')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            return path, self._regex_detect(content)
+        except Exception as e:
+            print(f"Error reading {path}: {e}")
+            return path, None
+    
+    def _regex_detect(self, content: str) -> Counter:
+        """Fallback regex-based detection."""
+        # Every match is longer than two characters; phrases contain a space,
+        # so only single words can be excluded
+        terms = Counter(map(_match_text, self._PHRASE_RE.finditer(content)))
+        exclude = self._REGEX_EXCLUDE
+        terms.update(
+            word for word in map(_match_text, self._WORD_RE.finditer(content))
+            if word not in exclude
+        )
+        return terms
+
+
+class ScanResultsModel(QAbstractTableModel):
+    """
+    Table model over one filter view of the scan results.
+    
+    Rows are indices into the scan's sorted (term, count, link, label)
+    list, so switching filters is a single model reset and cells are
+    only formatted when painted.
+    """
+    
+    HEADERS = ("Term", "Type", "Count", "Link", "Status", "Action")
+    ACTION_COLUMN = 5
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._terms: List[tuple] = []
+        self._indices: Sequence[int] = []
+        self._undefined: FrozenSet[int] = frozenset()
+        self._status: Optional[str] = None
+    
+    def set_rows(self, terms: List[tuple], indices: Sequence[int],
+                 undefined_idx: Sequence[int], status: Optional[str]) -> None:
+        """
+        Show terms[i] for each i in indices. status labels every row, or
+        None to label each as undefined/defined.
+        """
+        self.beginResetModel()
+        self._terms = terms
+        self._indices = indices
+        self._undefined = frozenset(undefined_idx)
+        self._status = status
+        self.endResetModel()
+    
+    def row_data(self, row: int) -> tuple:
+        """The (term, count, link, label) shown in a row."""
+        return self._terms[self._indices[row]]
+    
+    def is_undefined(self, row: int) -> bool:
+        return self._indices[row] in self._undefined
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._indices)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        term, count, link, label = self.row_data(index.row())
+        column = index.column()
+        
+        if role != Qt.DisplayRole:
+            if role == Qt.ToolTipRole and column == 3:
+                return link
+            return None
+        
+        if column == 0:
+            return term
+        if column == 1:
+            return label if label else "CONCEPT"
+        if column == 2:
+            return str(count)
+        if column == 3:
+            if not link:
+                return "—"
+            link_short = link[:40] + "..." if len(link) > 40 else link
+            return f"🔗 {link_short}"
+        if column == 4:
+            if self._status:
+                return self._status
+            return "🔴 Undefined" if self.is_undefined(index.row()) else "🟢 Defined"
+        if column == self.ACTION_COLUMN:
+            # Button caption, painted by _ActionButtonDelegate
+            if self.is_undefined(index.row()):
+                return "➕ Add Def"
+            if link:
+                return "🔗 Open"
+        return None
+
+
+class _ActionButtonDelegate(QStyledItemDelegate):
+    """Paints the action column as push buttons, without a widget per row."""
+    
+    clicked = Signal(QModelIndex)
+    
+    def paint(self, painter, option, index) -> None:
+        caption = index.data()
+        if not caption:
+            super().paint(painter, option, index)
+            return
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = caption
+        button.state = QStyle.State_Enabled
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+    
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and index.data()
+                and option.rect.contains(event.position().toPoint())):
+            self.clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class PaperScannerTab(QWidget):
@@ -412,12 +833,17 @@ class PaperScannerTab(QWidget):
         layout.addLayout(filter_layout)
         
         # Results table (expanded columns)
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(6)
-        self.results_table.setHorizontalHeaderLabels(["Term", "Type", "Count", "Link", "Status", "Action"])
+        self.results_model = ScanResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        action_delegate = _ActionButtonDelegate(self.results_table)
+        # Queued: the action may open a dialog and reset the model, which must
+        # not happen inside the view's own mouse handling
+        action_delegate.clicked.connect(self._on_result_action, Qt.QueuedConnection)
+        self.results_table.setItemDelegateForColumn(ScanResultsModel.ACTION_COLUMN, action_delegate)
         self.results_table.horizontalHeader().setStretchLastSection(True)
         self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.results_table.setSelectionBehavior(QTableView.SelectRows)
         self.results_table.setColumnWidth(1, 100)  # Type
         self.results_table.setColumnWidth(2, 60)   # Count
         self.results_table.setColumnWidth(3, 150)  # Link
@@ -571,14 +997,18 @@ class PaperScannerTab(QWidget):
             if f.is_dir() and not f.name.startswith('.')
         ])
         
+        # One walk of the folder, grouped by subfolder, for the tooltip counts
+        md_counts = Counter(
+            md_file.relative_to(self.papers_folder).parts[0]
+            for md_file in _iter_md(self.papers_folder)
+        )
+        
         for folder_name in subfolders:
             item = QListWidgetItem(folder_name)
             item.setCheckState(Qt.Unchecked)
             
             # Show file count in tooltip
-            folder_path = self.papers_folder / folder_name
-            md_count = len(list(folder_path.rglob("*.md")))
-            item.setToolTip(f"{md_count} markdown files")
+            item.setToolTip(f"{md_counts[folder_name]} markdown files")
             
             self.papers_list.addItem(item)
         
@@ -614,12 +1044,11 @@ class PaperScannerTab(QWidget):
                 QMessageBox.warning(self, "No Selection", "Please select at least one subfolder to scan,\nor enable 'Recursive' mode to scan everything.")
                 return
         
-        # Get existing definitions
-        existing_defs = set()
-        for def_obj in self.definitions_manager.get_all_definitions():
-            existing_defs.add(def_obj.phrase.lower())
-            for alias in def_obj.aliases:
-                existing_defs.add(alias.lower())
+        # Get existing definitions, lowercased once for the scanner
+        existing_defs = frozenset(itertools.chain.from_iterable(
+            (def_obj.phrase.lower(), *(alias.lower() for alias in def_obj.aliases))
+            for def_obj in self.definitions_manager.get_all_definitions()
+        ))
         
         # Start scan in background
         self.scan_btn.setEnabled(False)
@@ -664,22 +1093,23 @@ class PaperScannerTab(QWidget):
         )
         
         # Update breakdown
-        breakdown = "## Terms by Paper\n\n"
+        breakdown = ["## Terms by Paper\n\n"]
         for paper, terms in results['by_paper'].items():
             if terms:
                 top_terms = list(terms.items())[:10]
-                breakdown += f"### {paper}\n"
-                for term, count in top_terms:
-                    breakdown += f"- {term}: {count}\n"
-                breakdown += "\n"
+                breakdown.append(f"### {paper}\n")
+                breakdown.extend(f"- {term}: {count}\n" for term, count in top_terms)
+                breakdown.append("\n")
         
         # Add linked terms section
         if results.get('terms_with_links'):
-            breakdown += "---\n\n## 🔗 Discovered Links\n\n"
-            for term, link, source in results['terms_with_links'][:20]:
-                breakdown += f"- [{term}]({link}) *({source})*\n"
+            breakdown.append("---\n\n## 🔗 Discovered Links\n\n")
+            breakdown.extend(
+                f"- [{term}]({link}) *({source})*\n"
+                for term, link, source in results['terms_with_links'][:20]
+            )
         
-        self.breakdown_text.setMarkdown(breakdown)
+        self.breakdown_text.setMarkdown("".join(breakdown))
         
         # Apply filter to show results
         self._apply_filter()
@@ -689,75 +1119,31 @@ class PaperScannerTab(QWidget):
         if not self.scan_results:
             return
         
-        self.results_table.setRowCount(0)
-        
+        all_terms = self.scan_results['all_terms']
         filter_idx = self.filter_combo.currentIndex()
         
         if filter_idx == 0:  # Undefined
-            terms = self.scan_results['undefined_terms']
+            indices = self.scan_results['undefined_idx']
             status = "🔴 Undefined"
         elif filter_idx == 1:  # Defined
-            terms = self.scan_results['defined_terms']
+            indices = self.scan_results['defined_idx']
             status = "🟢 Defined"
         elif filter_idx == 2:  # With links
-            terms = [(t, 0, link, src) for t, link, src in self.scan_results.get('terms_with_links', [])]
+            indices = self.scan_results['linked_idx']
             status = "🔗 Linked"
         else:  # All
-            terms = self.scan_results['undefined_terms'] + self.scan_results['defined_terms']
+            indices = range(len(all_terms))
             status = None
         
-        for term_data in terms:
-            # Handle both old format (term, count) and new format (term, count, link, label)
-            if len(term_data) == 2:
-                term, count = term_data
-                link, label = None, "CONCEPT"
-            elif len(term_data) == 4:
-                term, count, link, label = term_data
-            else:
-                term = term_data[0]
-                count = term_data[1] if len(term_data) > 1 else 0
-                link = term_data[2] if len(term_data) > 2 else None
-                label = term_data[3] if len(term_data) > 3 else "CONCEPT"
-            
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-            
-            # Column 0: Term
-            self.results_table.setItem(row, 0, QTableWidgetItem(term))
-            
-            # Column 1: Type/Label
-            label_display = label if label else "CONCEPT"
-            self.results_table.setItem(row, 1, QTableWidgetItem(label_display))
-            
-            # Column 2: Count
-            self.results_table.setItem(row, 2, QTableWidgetItem(str(count)))
-            
-            # Column 3: Link
-            if link:
-                link_short = link[:40] + "..." if len(link) > 40 else link
-                link_item = QTableWidgetItem(f"🔗 {link_short}")
-                link_item.setToolTip(link)
-                self.results_table.setItem(row, 3, link_item)
-            else:
-                self.results_table.setItem(row, 3, QTableWidgetItem("—"))
-            
-            # Column 4: Status
-            if status:
-                self.results_table.setItem(row, 4, QTableWidgetItem(status))
-            else:
-                is_undefined = any(t[0] == term for t in self.scan_results['undefined_terms'])
-                self.results_table.setItem(row, 4, QTableWidgetItem("🔴 Undefined" if is_undefined else "🟢 Defined"))
-            
-            # Column 5: Action button
-            is_undefined = any(t[0] == term for t in self.scan_results['undefined_terms'])
-            if is_undefined:
-                action_btn = QPushButton("➕ Add Def")
-                action_btn.clicked.connect(lambda checked, t=term: self._quick_add_definition(t))
-                self.results_table.setCellWidget(row, 5, action_btn)
-            elif link:
-                open_btn = QPushButton("🔗 Open")
-                open_btn.clicked.connect(lambda checked, url=link: self._open_link(url))
-                self.results_table.setCellWidget(row, 5, open_btn)
+        self.results_model.set_rows(all_terms, indices, self.scan_results['undefined_idx'], status)
+    
+    def _on_result_action(self, index: QModelIndex) -> None:
+        """Run the action button clicked in a results row."""
+        term, _, link, _ = self.results_model.row_data(index.row())
+        if self.results_model.is_undefined(index.row()):
+            self._quick_add_definition(term)
+        elif link:
+            self._open_link(link)
     
     def _open_link(self, url: str) -> None:
         """Open a link in the browser."""
@@ -798,56 +1184,19 @@ class PaperScannerTab(QWidget):
         if reply != QMessageBox.Yes:
             return
         
-        created = 0
-        skipped = 0
-        
-        # Template for new definitions
-        template = '''---
-aliases: []
-title: {term}
-type: definition
-status: draft
-created: {date}
-papers: [{papers}]
----
-
-# {term}
-
-## 1. Aliases
-<!-- Other names, symbols -->
-
-## 2. Core Definition
-<!-- ONE SENTENCE. What this IS. -->
-
-## 3. Operational Definition
-<!-- How it FUNCTIONS in Theophysics -->
-
-## 4. Ontological Context
-<!-- Triad/Domain/Layer -->
-
-## 5. Relationships
-| Relation | Term |
-|----------|------|
-| Parent | |
-| Children | |
-| See Also | |
-
-## 6. Scientific Definition
-<!-- Standard physics definition -->
-
-## 7. Narrative Definition
-<!-- Simple explanation -->
-
----
-## Metadata
-**Found in papers:** {papers}
-**Occurrences:** {count}
-**Tags:** #glossary #theophysics #needs-definition
-'''
-        
         from datetime import datetime
         date = datetime.now().strftime("%Y-%m-%d")
         
+        # Papers each term appears in, inverted from by_paper once
+        term_to_papers: Dict[str, List[str]] = {}
+        for paper, terms in self.scan_results.get('by_paper', {}).items():
+            for term in terms:
+                term_to_papers.setdefault(term, []).append(paper)
+        
+        # One file per distinct filename; terms that clean to the same name
+        # as an earlier term are skipped, as they would find it existing
+        jobs = {}
+        skipped = 0
         for term_data in undefined_terms:
             term = term_data[0]
             count = term_data[1] if len(term_data) > 1 else 1
@@ -855,31 +1204,26 @@ papers: [{papers}]
             # Clean term for filename
             safe_name = "".join(c if c.isalnum() or c in " -_" else "_" for c in term)
             file_path = glossary_folder / f"{safe_name}.md"
-            
-            if file_path.exists():
+            if file_path in jobs:
                 skipped += 1
                 continue
             
             # Determine which papers this term appears in
-            papers = []
-            if 'by_paper' in self.scan_results:
-                for paper, terms in self.scan_results['by_paper'].items():
-                    if term in terms:
-                        papers.append(paper)
+            papers = term_to_papers.get(term)
             papers_str = ", ".join(papers) if papers else "various"
             
-            content = template.format(
+            jobs[file_path] = _NEW_DEFINITION_TEMPLATE.format(
                 term=term,
                 date=date,
                 papers=papers_str,
                 count=count
-            )
-            
-            try:
-                file_path.write_text(content, encoding='utf-8')
-                created += 1
-            except Exception as e:
-                print(f"Error creating {file_path}: {e}")
+            ).encode('utf-8')
+        
+        # Independent small files; overlap their I/O
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outcomes = list(executor.map(_create_file, jobs.keys(), jobs.values()))
+        created = outcomes.count(True)
+        skipped += outcomes.count(False)
         
         QMessageBox.information(
             self,
@@ -920,7 +1264,7 @@ papers: [{papers}]
         
         coverage = (defined / max(total_terms, 1)) * 100
         
-        dashboard = f'''---
+        parts = [f'''---
 type: dashboard
 updated: {date}
 ---
@@ -948,32 +1292,30 @@ Undefined:  {"█" * int((100-coverage) / 5)}{"░" * (20 - int((100-coverage) /
 
 ## Terms by Paper
 
-'''
+''']
         
         if 'by_paper' in self.scan_results:
             for paper, terms in sorted(self.scan_results['by_paper'].items()):
                 term_count = len(terms) if isinstance(terms, dict) else 0
-                dashboard += f"### {paper}\n"
-                dashboard += f"- **Terms found:** {term_count}\n"
+                parts.append(f"### {paper}\n- **Terms found:** {term_count}\n")
                 if isinstance(terms, dict):
                     top_5 = list(terms.items())[:5]
-                    for term, count in top_5:
-                        dashboard += f"  - {term}: {count}\n"
-                dashboard += "\n"
+                    parts.extend(f"  - {term}: {count}\n" for term, count in top_5)
+                parts.append("\n")
         
-        dashboard += '''
+        parts.append('''
 ## Top Undefined Terms
 
 | Term | Occurrences | Status |
 |------|-------------|--------|
-'''
+''')
         
         for term_data in self.scan_results.get('undefined_terms', [])[:20]:
             term = term_data[0]
             count = term_data[1] if len(term_data) > 1 else 0
-            dashboard += f"| {term} | {count} | 🔴 Needs definition |\n"
+            parts.append(f"| {term} | {count} | 🔴 Needs definition |\n")
         
-        dashboard += '''
+        parts.append('''
 
 ## Actions Needed
 
@@ -985,11 +1327,11 @@ Undefined:  {"█" * int((100-coverage) / 5)}{"░" * (20 - int((100-coverage) /
 ---
 
 *Generated by Theophysics Research Manager*
-'''
+''')
         
         # Save dashboard
         dashboard_file = dashboard_folder / "Paper_Scanner_Dashboard.md"
-        dashboard_file.write_text(dashboard, encoding='utf-8')
+        dashboard_file.write_text("".join(parts), encoding='utf-8')
         
         QMessageBox.information(
             self,
@@ -1015,8 +1357,7 @@ Undefined:  {"█" * int((100-coverage) / 5)}{"░" * (20 - int((100-coverage) /
         )
         
         if file_path:
-            content = "## Research Links\n\n"
-            content += "*Auto-generated from paper scan*\n\n"
+            parts = ["## Research Links\n\n", "*Auto-generated from paper scan*\n\n"]
             
             # Group by source
             sep_links = []
@@ -1032,22 +1373,17 @@ Undefined:  {"█" * int((100-coverage) / 5)}{"░" * (20 - int((100-coverage) /
                 else:
                     other_links.append(entry)
             
-            if sep_links:
-                content += "### Stanford Encyclopedia of Philosophy\n\n"
-                content += "\n".join(sorted(set(sep_links)))
-                content += "\n\n"
-            
-            if wiki_links:
-                content += "### Wikipedia\n\n"
-                content += "\n".join(sorted(set(wiki_links)))
-                content += "\n\n"
+            for heading, links in (
+                ("Stanford Encyclopedia of Philosophy", sep_links),
+                ("Wikipedia", wiki_links),
+                ("Other Sources", other_links),
+            ):
+                if links:
+                    parts.append(f"### {heading}\n\n")
+                    parts.append("\n".join(sorted(set(links))))
+                    parts.append("\n\n")
             
-            if other_links:
-                content += "### Other Sources\n\n"
-                content += "\n".join(sorted(set(other_links)))
-                content += "\n\n"
-            
-            Path(file_path).write_text(content, encoding='utf-8')
+            Path(file_path).write_text("".join(parts), encoding='utf-8')
             QMessageBox.information(self, "Exported", f"Exported {len(self.scan_results['terms_with_links'])} links to {file_path}")
     
     def _add_definition_for_selected(self) -> None:
@@ -1057,8 +1393,7 @@ Undefined:  {"█" * int((100-coverage) / 5)}{"░" * (20 - int((100-coverage) /
             QMessageBox.warning(self, "No Selection", "Please select a term from the table.")
             return
         
-        row = selected_rows[0].row()
-        term = self.results_table.item(row, 0).text()
+        term = self.results_model.row_data(selected_rows[0].row())[0]
         self._quick_add_definition(term)
     
     def _quick_add_definition(self, term: str) -> None:
@@ -1079,11 +1414,13 @@ Undefined:  {"█" * int((100-coverage) / 5)}{"░" * (20 - int((100-coverage) /
                 # Rescan to update status
                 if self.scan_results:
                     # Move from undefined to defined
-                    self.scan_results['undefined_terms'] = [
-                        (t, c) for t, c in self.scan_results['undefined_terms'] if t != term
-                    ]
-                    count = next((c for t, c in self.scan_results['proper_nouns'].items() if t == term), 1)
-                    self.scan_results['defined_terms'].append((term, count))
+                    results = self.scan_results
+                    moved = [i for i in results['undefined_idx'] if results['all_terms'][i][0] == term]
+                    if moved:
+                        results['undefined_idx'] = [i for i in results['undefined_idx'] if i not in moved]
+                        results['defined_idx'] = sorted(results['defined_idx'] + moved)
+                        results['undefined_terms'] = [results['all_terms'][i] for i in results['undefined_idx']]
+                        results['defined_terms'] = [results['all_terms'][i] for i in results['defined_idx']]
                     self._apply_filter()
             else:
                 QMessageBox.warning(self, "Error", "Failed to add definition.")
@@ -1104,14 +1441,18 @@ Undefined:  {"█" * int((100-coverage) / 5)}{"░" * (20 - int((100-coverage) /
         )
         
         if file_path:
-            content = "# Undefined Terms Report\n\n"
-            content += f"Generated from paper scan\n\n"
-            content += "| Term | Occurrences |\n"
-            content += "|------|-------------|\n"
-            
-            for term, count in sorted(self.scan_results['undefined_terms'], key=lambda x: -x[1]):
-                content += f"| {term} | {count} |\n"
+            parts = [
+                "# Undefined Terms Report\n\n",
+                "Generated from paper scan\n\n",
+                "| Term | Occurrences |\n",
+                "|------|-------------|\n",
+            ]
+            # Rows are (term, count, link, label), already sorted by count
+            parts.extend(
+                f"| {term_data[0]} | {term_data[1]} |\n"
+                for term_data in self.scan_results['undefined_terms']
+            )
             
-            Path(file_path).write_text(content, encoding='utf-8')
+            Path(file_path).write_text("".join(parts), encoding='utf-8')
             QMessageBox.information(self, "Exported", f"Exported {len(self.scan_results['undefined_terms'])} terms to {file_path}")
 
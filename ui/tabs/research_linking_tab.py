@@ -362,8 +362,7 @@ class ResearchLinkingTab(QWidget):
         
         for source in priority:
             if source in self.research_linker.LINK_TEMPLATES:
-                template = self.research_linker.LINK_TEMPLATES[source]
-                display_name = template.get('display_name', source.replace('_', ' ').title())
+                display_name = self.research_linker.display_name(source)
                 item = QListWidgetItem(f"{display_name} ({source})")
                 item.setData(Qt.UserRole, source)
                 self.priority_list.addItem(item)